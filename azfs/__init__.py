@@ -3,6 +3,7 @@ from azfs.az_file_client import (
     export_decorator
 )
 
+from azfs.async_az_file_client import AsyncAzFileClient
 from azfs.az_file_system import AzFileSystem
 from azfs.utils import BlobPathDecoder
 
@@ -17,6 +18,7 @@ VERSION = (0, 2, 14)
 __version__ = ".".join(map(str, VERSION))
 
 __all__ = [
+    "AsyncAzFileClient",
     "AzFileClient",
     "AzFileSystem",
     "BlobPathDecoder",
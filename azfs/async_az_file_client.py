@@ -0,0 +1,337 @@
+import asyncio
+from functools import partial
+import gzip
+import io
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob.aio import BlobServiceClient
+from azure.storage.filedatalake.aio import DataLakeServiceClient
+from azfs.error import AzfsInputError
+from azfs.utils import (
+    BlobPathDecoder,
+    decompress_stream,
+    is_gzip_compressed,
+    load_json_bytes,
+    load_parquet_bytes,
+    load_pickle_stream
+)
+
+__all__ = ["AsyncAzFileClient"]
+
+
+class AsyncAzFileClient:
+    """
+    AsyncAzFileClient provides ``async`` version of reading functions of AzFileClient,
+    in order to download many files concurrently on one event loop.
+    `aiohttp` is required to use the class, install it with ``pip install azfs[async]``.
+
+    Examples:
+        >>> import asyncio
+        >>> import azfs
+        >>> path_list = [
+        ...     "https://testazfs.blob.core.windows.net/test_container/test1.csv",
+        ...     "https://testazfs.blob.core.windows.net/test_container/test2.csv"
+        ... ]
+        >>> async def main():
+        ...     async with azfs.AsyncAzFileClient() as aazc:
+        ...         return await asyncio.gather(*[aazc.read_csv(p) for p in path_list])
+        >>> df_list = asyncio.run(main())
+    """
+    # number of parallel connections to download a file
+    MAX_CONCURRENCY = 8
+    # number of files to download or upload at the same time in ``get_many()`` and ``put_many()``
+    MAX_REQUESTS = 64
+
+    def __init__(
+            self,
+            credential: Optional[Union[str, DefaultAzureCredential]] = None,
+            connection_string: Optional[str] = None):
+        """
+        if every argument is None, set credential as azure.identity.aio.DefaultAzureCredential().
+
+        Args:
+            credential: if string, Blob Storage -> Access Keys -> Key
+            connection_string: connection_string
+        """
+        # DefaultAzureCredential is created with the first service client, because it also requires `aiohttp`
+        self._owns_credential = credential is None and connection_string is None
+        self._credential = credential
+        self._connection_string = connection_string
+        # service clients are created once for each account, and reused
+        self._service_client_dict = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exec_type, exec_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        close service clients, and the credential created in the instance.
+
+        Returns:
+            None
+        """
+        for service_client in self._service_client_dict.values():
+            await service_client.close()
+        self._service_client_dict.clear()
+        if self._owns_credential and self._credential is not None:
+            await self._credential.close()
+            self._credential = None
+
+    def _get_service_client(self, account_url: str, account_kind: str):
+        """
+        get BlobServiceClient or DataLakeServiceClient of ``azure.storage.*.aio``
+
+        Args:
+            account_url:
+            account_kind: blob or dfs
+
+        Returns:
+            Union[BlobServiceClient, DataLakeServiceClient]
+        """
+        key = (account_url, account_kind)
+        service_client = self._service_client_dict.get(key)
+        if service_client is not None:
+            return service_client
+
+        if account_kind == "blob":
+            service_client_class = BlobServiceClient
+        elif account_kind == "dfs":
+            service_client_class = DataLakeServiceClient
+        else:
+            raise AzfsInputError(f"account_kind `{account_kind}` is not supported")
+
+        if self._owns_credential and self._credential is None:
+            self._credential = DefaultAzureCredential()
+
+        if self._credential is not None:
+            service_client = service_client_class(account_url=account_url, credential=self._credential)
+        else:
+            service_client = service_client_class.from_connection_string(conn_str=self._connection_string)
+        self._service_client_dict[key] = service_client
+        return service_client
+
+    def _get_file_client(self, path: str) -> tuple:
+        """
+        get BlobClient or DataLakeFileClient of ``azure.storage.*.aio``
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+
+        Returns:
+            tuple of Union[BlobClient, DataLakeFileClient] and account_kind
+        """
+        account_url, account_kind, file_system, file_path = BlobPathDecoder.decode_with_url(path)
+        service_client = self._get_service_client(account_url=account_url, account_kind=account_kind)
+        if account_kind == "blob":
+            return service_client.get_blob_client(container=file_system, blob=file_path), account_kind
+        return service_client.get_file_client(file_system=file_system, file_path=file_path), account_kind
+
+    async def _download(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            **kwargs) -> bytes:
+        """
+        download bytes from Azure Blob Storage as it is.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            offset:
+            length:
+            **kwargs: ``max_concurrency`` is acceptable
+
+        Returns:
+            bytes
+        """
+        file_client, account_kind = self._get_file_client(path)
+        max_concurrency = kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
+        if account_kind == "blob":
+            downloader = await file_client.download_blob(
+                offset=offset, length=length, max_concurrency=max_concurrency)
+        else:
+            downloader = await file_client.download_file(
+                offset=offset, length=length, max_concurrency=max_concurrency)
+        return await downloader.readall()
+
+    async def _get(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            **kwargs) -> Union[io.BytesIO, gzip.GzipFile]:
+        """
+        get data from Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            offset:
+            length:
+            **kwargs: ``max_concurrency`` is acceptable
+
+        Returns:
+            some data
+        """
+        file_bytes = await self._download(path, offset=offset, length=length, **kwargs)
+        file_to_read = io.BytesIO(file_bytes)
+
+        if is_gzip_compressed(path=path, data=file_bytes):
+            file_to_read = decompress_stream(file_to_read, compression="gzip")
+        return file_to_read
+
+    async def _put(self, path: str, data, **kwargs) -> bool:
+        """
+        upload data to Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            data: some data to upload.
+            **kwargs: ``max_concurrency`` is acceptable
+
+        Returns:
+            True if correctly uploaded
+        """
+        file_client, account_kind = self._get_file_client(path)
+        max_concurrency = kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
+        if account_kind == "blob":
+            await file_client.upload_blob(data=data, overwrite=True, max_concurrency=max_concurrency)
+        else:
+            await file_client.upload_data(data=data, overwrite=True, max_concurrency=max_concurrency)
+        return True
+
+    async def get_many(self, path_list: List[str], **kwargs) -> List[bytes]:
+        """
+        download many files concurrently, at most ``MAX_REQUESTS`` files at the same time.
+
+        Args:
+            path_list: list of Azure Blob path URL format
+            **kwargs: ``max_concurrency`` is acceptable
+
+        Returns:
+            list of bytes, in the same order as the ``path_list``
+
+        Examples:
+            >>> import asyncio
+            >>> import azfs
+            >>> async def main():
+            ...     async with azfs.AsyncAzFileClient() as aazc:
+            ...         return await aazc.get_many(path_list)
+            >>> data_list = asyncio.run(main())
+        """
+        semaphore = asyncio.Semaphore(self.MAX_REQUESTS)
+
+        async def _download(path: str) -> bytes:
+            async with semaphore:
+                return await self._download(path, **kwargs)
+        return list(await asyncio.gather(*[_download(path) for path in path_list]))
+
+    async def put_many(self, path_data_dict: Dict[str, Any], **kwargs) -> bool:
+        """
+        upload many files concurrently, at most ``MAX_REQUESTS`` files at the same time.
+
+        Args:
+            path_data_dict: dict of Azure Blob path URL format and the data to upload
+            **kwargs: ``max_concurrency`` is acceptable
+
+        Returns:
+            True if all files are correctly uploaded
+        """
+        semaphore = asyncio.Semaphore(self.MAX_REQUESTS)
+
+        async def _upload(path: str, data) -> bool:
+            async with semaphore:
+                return await self._put(path, data, **kwargs)
+        return all(await asyncio.gather(*[_upload(path, data) for path, data in path_data_dict.items()]))
+
+    @staticmethod
+    async def _run_in_executor(func, *args, **kwargs):
+        """
+        parse the downloaded data in the default executor,
+        so that the other downloads go on the event loop in the meantime.
+
+        Args:
+            func: function to parse the data
+            *args: arguments to put func
+            **kwargs: keywords to put func
+
+        Returns:
+            the result of func
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def read_csv(self, path: str, **kwargs) -> pd.DataFrame:
+        """
+        get csv data as pd.DataFrame from Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            **kwargs: keywords to put df.read_csv(), such as ``header``, ``encoding``.
+
+        Returns:
+            pd.DataFrame
+        """
+        file_to_read = await self._get(path)
+        return await self._run_in_executor(pd.read_csv, file_to_read, **kwargs)
+
+    async def read_table(self, path: str, **kwargs) -> pd.DataFrame:
+        """
+        get tsv data as pd.DataFrame from Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.tsv``
+            **kwargs: keywords to put df.read_table(), such as ``header``, ``encoding``.
+
+        Returns:
+            pd.DataFrame
+        """
+        file_to_read = await self._get(path)
+        return await self._run_in_executor(pd.read_table, file_to_read, **kwargs)
+
+    async def read_pickle(self, path: str, compression="gzip") -> pd.DataFrame:
+        """
+        get pickled-pandas data as pd.DataFrame from Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.pkl``
+            compression: acceptable keywords are: gzip, bz2, xz, zstd, lz4. gzip is default value.
+
+        Returns:
+            pd.DataFrame
+        """
+        file_to_read = await self._get(path)
+        return await self._run_in_executor(load_pickle_stream, file_to_read, compression=compression)
+
+    async def read_parquet(self, path: str) -> pd.DataFrame:
+        """
+        get parquet data as pd.DataFrame from Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test.parquet``
+
+        Returns:
+            pd.DataFrame
+        """
+        data = await self._download(path)
+        return await self._run_in_executor(load_parquet_bytes, path=path, data=data)
+
+    async def read_json(self, path: str, **kwargs) -> dict:
+        """
+        read json file in Azure Blob Storage.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.json``
+            **kwargs: keywords to put json.loads(), such as ``parse_float``.
+                ``use_orjson=True`` parses with ``orjson`` if installed, see ``azfs.utils.json_loads()``.
+
+        Returns:
+            dict
+        """
+        # parse the downloaded bytes directly, without copying them via io.BytesIO
+        file_bytes = await self._download(path)
+        return await self._run_in_executor(load_json_bytes, path=path, data=file_bytes, **kwargs)
@@ -1,16 +1,19 @@
-import bz2
+import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import copy
-from functools import partial
+from functools import lru_cache, partial
 import gzip
 import io
 from inspect import signature
-import json
 from logging import getLogger, INFO
-import lzma
 import multiprocessing as mp
 import pickle
 import re
+import shutil
 import sys
+import threading
+import time
 import traceback as trc
 # to accept all typing.*
 from typing import *
@@ -19,7 +22,8 @@ import warnings
 import pandas as pd
 from azure.identity import DefaultAzureCredential
 from azure.core.exceptions import ResourceNotFoundError
-from azfs.clients import AzfsClient, TextReader
+from azfs.async_az_file_client import AsyncAzFileClient
+from azfs.clients import AzfsClient, ByteReader, ByteReaderIO, TextReader
 from azfs.error import (
     AzfsInputError,
     AzfsDecoratorFileFormatError,
@@ -28,7 +32,15 @@ from azfs.error import (
 )
 from azfs.utils import (
     BlobPathDecoder,
-    ls_filter
+    compress_stream,
+    decompress_stream,
+    is_gzip_compressed,
+    json_dumps,
+    load_json_bytes,
+    load_parquet_bytes,
+    load_pickle_stream,
+    MemoryViewIO,
+    pickle_dumps_out_of_band
 )
 
 __all__ = ["AzFileClient", "ExportDecorator", "export_decorator"]
@@ -60,6 +72,22 @@ class ExportDecorator:
 export_decorator = ExportDecorator()
 
 
+@lru_cache(maxsize=128)
+def _compile_glob_pattern(pattern_path: str) -> Pattern:
+    """
+    convert the wildcard-pattern to the compiled regular-expression.
+    ``*`` matches any characters except ``/``, and the other characters are escaped.
+
+    Args:
+        pattern_path: ex: ``some_folder/*/*.csv``
+
+    Returns:
+        compiled pattern
+    """
+    escaped_pattern_list = [re.escape(p) for p in pattern_path.split("*")]
+    return re.compile(f"{'[^/]*'.join(escaped_pattern_list)}$")
+
+
 def _wrap_quick_load(inputs: dict):
     """
     read wrapper function for multiprocessing.
@@ -131,17 +159,22 @@ class DataFrameReader:
             path: Union[str, List[str]] = None,
             use_mp=False,
             cpu_count: Optional[int] = None,
+            max_workers: Optional[int] = None,
             file_format: Optional[str] = None):
         self._azc: AzFileClient = _azc
         # DefaultCredential cannot be pickle (when use multiprocessing), so make it None
         self._credential = credential if type(credential) is str else None
+        # the last pattern given to glob, and its result
+        self._glob_pattern: Optional[str] = None
+        self._glob_path_list: List[str] = []
         self.path: Optional[List[str]] = self._decode_path(path=path)
         self.file_format = file_format
         self.use_mp = use_mp
         self.cpu_count = mp.cpu_count() if cpu_count is None else cpu_count
+        self.max_workers = max_workers
         self._apply_method = None
 
-    def _decode_path(self, path: Optional[Union[str, List[str]]]) -> Optional[List[str]]:
+    def _decode_path(self, path: Optional[Union[str, List[str], Tuple[str]]]) -> Optional[List[str]]:
         """
         decode path to be read by azc
 
@@ -153,16 +186,17 @@ class DataFrameReader:
         """
         if path is None:
             return None
-        elif type(path) is str:
-            if "*" in path:
-                decoded_path = self._azc.glob(pattern_path=path)
-            else:
-                decoded_path = [path]
-        elif type(path) is list:
-            decoded_path = path
-        else:
-            raise AzfsInputError("path must be `str` or `list`")
-        return decoded_path
+        if isinstance(path, str):
+            if "*" not in path:
+                return [path]
+            # glob lists files in the storage, so reuse the result for the same pattern
+            if path != self._glob_pattern:
+                self._glob_path_list = self._azc.glob(pattern_path=path)
+                self._glob_pattern = path
+            return list(self._glob_path_list)
+        if isinstance(path, (list, tuple)):
+            return list(path)
+        raise AzfsInputError("path must be `str`, `list` or `tuple`")
 
     def csv(self, path: Union[str, List[str]] = None, **kwargs) -> pd.DataFrame:
         """
@@ -170,7 +204,8 @@ class DataFrameReader:
 
         Args:
             path: azure blob path
-            **kwargs: as same as pandas.read_csv
+            **kwargs: as same as pandas.read_csv.
+                specifying ``dtype``, such as ``category`` for low-cardinality columns, reduces memory to concat.
 
         Returns:
             pd.DataFrame
@@ -192,6 +227,10 @@ class DataFrameReader:
             >>> df = azc.read().csv(blob_path_pattern)
             # you can use multiprocessing with `use_mp` argument
             >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            # without multiprocessing, files are read with threads, and the number can be set by `max_workers`
+            >>> df = azc.read(max_workers=4).csv(blob_path_pattern)
+            # keyword arguments are passed to pd.read_csv, such as `dtype`
+            >>> df = azc.read().csv(blob_path_pattern, dtype={"id": "category"})
             # if you want to filter or apply some method, you can use your defined function as below
             >>> def filter_function(_df: pd.DataFrame, _id: str) -> pd.DataFrame:
             ...     return _df[_df['id'] == _id]
@@ -226,7 +265,7 @@ class DataFrameReader:
 
         Args:
             path: azure blob path
-            compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+            compression: acceptable keywords are: gzip, bz2, xz, zstd, lz4. gzip is default value.
 
         Returns:
             pd.DataFrame
@@ -237,19 +276,23 @@ class DataFrameReader:
             self.path = self._decode_path(path=path)
         return self._load(compression=compression)
 
-    def _load_function(self) -> callable:
+    def _load_function(self, _azc=None) -> callable:
         """
         get read_* function according to the file_format
 
+        Args:
+            _azc: AzFileClient or AsyncAzFileClient. Default, AzFileClient given at initialization
+
         Returns:
 
         """
+        _azc = self._azc if _azc is None else _azc
         if self.file_format == "csv":
-            load_function = self._azc.read_csv
+            load_function = _azc.read_csv
         elif self.file_format == "parquet":
-            load_function = self._azc.read_parquet
+            load_function = _azc.read_parquet
         elif self.file_format == "pickle":
-            load_function = self._azc.read_pickle
+            load_function = _azc.read_pickle
         else:
             raise AzfsInputError("file_format is incorrect")
         return load_function
@@ -274,6 +317,8 @@ class DataFrameReader:
     def _load(self, **kwargs) -> Optional[pd.DataFrame]:
         if self.path is None:
             raise AzfsInputError("input azure blob path")
+        if len(self.path) == 0:
+            return None
 
         if self.use_mp:
             params_list = []
@@ -291,13 +336,69 @@ class DataFrameReader:
             pool.join()
         else:
             load_function = self._load_function()
-            if self._apply_method is None:
-                df_list = [load_function(f, **kwargs) for f in self.path]
-            else:
-                df_list = [self._apply_method(load_function(f, **kwargs)) for f in self.path]
-        if len(df_list) == 0:
+
+            def _load_and_apply(f: str) -> pd.DataFrame:
+                df = load_function(f, **kwargs)
+                if self._apply_method is None:
+                    return df
+                return self._apply_method(df)
+
+            # reading files is I/O-bound, so threads can download them concurrently
+            max_workers = min(32, len(self.path)) if self.max_workers is None else self.max_workers
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                df_list = list(executor.map(_load_and_apply, self.path))
+        return self._concat(df_list, **kwargs)
+
+    def _concat(self, df_list: List[pd.DataFrame], **kwargs) -> pd.DataFrame:
+        """
+        concat DataFrames without copying blocks.
+        The index of csv is re-numbered, unless ``index_col`` is specified.
+
+        Args:
+            df_list: DataFrames to concat
+            **kwargs: keywords given to the read_* function
+
+        Returns:
+            pd.DataFrame
+        """
+        ignore_index = self.file_format == "csv" and kwargs.get("index_col") is None
+        return pd.concat(df_list, copy=False, ignore_index=ignore_index)
+
+    async def load_async(self, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        read files concurrently on the running event loop with ``AsyncAzFileClient``.
+        `aiohttp` is required, install it with ``pip install azfs[async]``.
+
+        Args:
+            **kwargs: as same as the read_* function according to the file_format
+
+        Returns:
+            pd.DataFrame
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> blob_path_pattern = "https://testazfs.blob.core.windows.net/test_container/test*.csv"
+            >>> df = await azc.read(path=blob_path_pattern, file_format="csv").load_async()
+        """
+        if self.path is None:
+            raise AzfsInputError("input azure blob path")
+        if len(self.path) == 0:
             return None
-        return pd.concat(df_list)
+
+        async with AsyncAzFileClient(
+                credential=self._credential,
+                connection_string=self._azc._connection_string) as aazc:
+            load_function = self._load_function(_azc=aazc)
+            semaphore = asyncio.Semaphore(aazc.MAX_REQUESTS)
+
+            async def _load(f: str):
+                async with semaphore:
+                    return await load_function(f, **kwargs)
+            df_list = await asyncio.gather(*[_load(f) for f in self.path])
+        if self._apply_method is not None:
+            df_list = [self._apply_method(df) for df in df_list]
+        return self._concat(df_list, **kwargs)
 
 
 class AzFileClient:
@@ -332,6 +433,9 @@ class AzFileClient:
         """
         def __init__(self):
             self.register_list = []
+            # clients in nested `with` statements. functions are set only when the innermost client changes
+            self._client_stack = []
+            self._lock = threading.Lock()
 
         def register(self, _as: str, _to: object):
             """
@@ -348,7 +452,7 @@ class AzFileClient:
             """
             def _register(function):
                 """
-                append ``wrapper`` function
+                append the name of ``function``
 
                 Args:
                     function:
@@ -356,52 +460,55 @@ class AzFileClient:
                 Returns:
 
                 """
-                def wrapper(class_instance):
-                    """
-                    accept instance in kwargs as name of ``az_file_client_instance``
-
-                    Args:
-                        class_instance: always instance of AzFileClient
-
-                    Returns:
+                function_info = {
+                    "assign_as": _as,
+                    "assign_to": _to,
+                    "function_name": function.__name__
+                }
+                self.register_list.append(function_info)
 
-                    """
+                return function
 
-                    def new_function(*args, **kwargs):
-                        """
-                        actual wrapped function
+            return _register
 
-                        Args:
-                            *args:
-                            **kwargs:
+        @staticmethod
+        def _wrap(class_instance, function_name: str) -> callable:
+            """
+            wrap the function of ``class_instance`` to be called from pandas
 
-                        Returns:
+            Args:
+                class_instance: always instance of AzFileClient
+                function_name: name of the function to call
 
-                        """
-                        target_function = getattr(class_instance, function.__name__)
+            Returns:
+                wrapped function
+            """
+            def new_function(*args, **kwargs):
+                """
+                actual wrapped function
 
-                        df = args[0] if isinstance(args[0], pd.DataFrame) else None
-                        if df is not None:
-                            kwargs['df'] = args[0]
-                            return target_function(*args[1:], **kwargs)
-                        return target_function(*args, **kwargs)
+                Args:
+                    *args:
+                    **kwargs:
 
-                    return new_function
+                Returns:
 
-                function_info = {
-                    "assign_as": _as,
-                    "assign_to": _to,
-                    "function": wrapper
-                }
-                self.register_list.append(function_info)
+                """
+                target_function = getattr(class_instance, function_name)
 
-                return function
+                df = args[0] if isinstance(args[0], pd.DataFrame) else None
+                if df is not None:
+                    kwargs['df'] = args[0]
+                    return target_function(*args[1:], **kwargs)
+                return target_function(*args, **kwargs)
 
-            return _register
+            return new_function
 
         def attach(self, client: object):
             """
-            set new function as attribute based on self.register_list
+            set new function as attribute based on self.register_list.
+            wrapped functions are created once for each client, and reused.
+            nothing is set if the client is already attached, as in nested `with` statements.
 
             Args:
                 client: set AzFileClient always
@@ -410,22 +517,57 @@ class AzFileClient:
                 None
 
             """
-            for f in self.register_list:
-                setattr(f['assign_to'], f['assign_as'], f['function'](class_instance=client))
+            with self._lock:
+                if not self._client_stack or self._client_stack[-1] is not client:
+                    self._set_functions(client=client)
+                self._client_stack.append(client)
 
-        def detach(self):
+        def detach(self, client: object):
             """
-            set None based on self.register_list
+            remove the exiting client, and set None based on self.register_list when no client is left.
+            the functions of the client on the top are set again, if the top is changed.
+            clients exiting out of order, as in threads, remove only their own entry.
+
+            Args:
+                client: set AzFileClient always
 
             Returns:
                 None
 
             """
+            with self._lock:
+                previous_top = self._client_stack[-1] if self._client_stack else None
+                for i in range(len(self._client_stack) - 1, -1, -1):
+                    if self._client_stack[i] is client:
+                        del self._client_stack[i]
+                        break
+                if not self._client_stack:
+                    for f in self.register_list:
+                        setattr(f['assign_to'], f['assign_as'], None)
+                elif self._client_stack[-1] is not previous_top:
+                    self._set_functions(client=self._client_stack[-1])
+
+        def _set_functions(self, client: object):
+            wrapped_function_dict = getattr(client, "_az_context_function_dict", None)
+            if wrapped_function_dict is None:
+                wrapped_function_dict = {
+                    f['assign_as']: self._wrap(class_instance=client, function_name=f['function_name'])
+                    for f in self.register_list
+                }
+                setattr(client, "_az_context_function_dict", wrapped_function_dict)
             for f in self.register_list:
-                setattr(f['assign_to'], f['assign_as'], None)
+                setattr(f['assign_to'], f['assign_as'], wrapped_function_dict[f['assign_as']])
 
     # instance for context manager
     _az_context_manager = AzContextManager()
+    # seconds to keep the result of ``exists()``
+    EXISTENCE_CACHE_TTL = 30
+    # number of paths to keep the result of ``exists()``, the oldest ones are removed first
+    EXISTENCE_CACHE_MAX_SIZE = 100000
+    # seconds to keep the result of ``info()``, shared with ``size()``, ``checksum()``, ``isdir()`` and ``isfile()``
+    INFO_CACHE_TTL = 5
+    # number of paths to keep the result of ``info()``, the oldest ones are removed first
+    INFO_CACHE_MAX_SIZE = 1000
 
     def __init__(
             self,
@@ -442,6 +584,12 @@ class AzFileClient:
             credential = DefaultAzureCredential()
         self._client = AzfsClient(credential=credential, connection_string=connection_string)
         self._credential = credential
+        self._connection_string = connection_string
+        # path -> (cached time, exists or not), ordered by the cached time
+        self._existence_cache: Dict[str, Tuple[float, bool]] = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        # path -> (cached time, file properties), ordered by the cached time
+        self._info_cache: Dict[str, Tuple[float, dict]] = collections.OrderedDict()
 
     def __enter__(self):
         """
@@ -456,7 +604,8 @@ class AzFileClient:
 
     def __exit__(self, exec_type, exec_value, traceback):
         """
-        remove some functions from pandas module based on AzContextManager()
+        remove some functions from pandas module based on AzContextManager(),
+        and close http sessions.
 
         Args:
             exec_type:
@@ -466,7 +615,18 @@ class AzFileClient:
         Returns:
             None
         """
-        self._az_context_manager.detach()
+        self._az_context_manager.detach(client=self)
+        self.close()
+
+    def close(self):
+        """
+        close http sessions kept by the clients.
+        The sessions are created again when the next request is sent.
+
+        Returns:
+            None
+        """
+        self._client.close()
 
     def exists(self, path: str) -> bool:
         """
@@ -487,14 +647,104 @@ class AzFileClient:
             >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/not_exist_test1.csv"
             >>> azc.exists(path=csv_path)
             False
+            folder in blob storage exists if any file is in the folder
+            >>> azc.exists(path="https://testazfs.blob.core.windows.net/test_container/some_folder/")
+            True
 
         """
+        cached = self._existence_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < self.EXISTENCE_CACHE_TTL:
+            return cached[1]
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(path)
+        if account_kind == "blob" and file_path.endswith("/"):
+            # blob storage has no folder, so that find a file starting with the path, without listing all
+            result = self._client.get_client(account_kind=account_kind).exists_prefix(path=path, file_path=file_path)
+            self._set_existence_cache(path=path, exists=result)
+            return result
         try:
             _ = self.info(path=path)
         except ResourceNotFoundError:
-            return False
+            result = False
         else:
-            return True
+            result = True
+        self._set_existence_cache(path=path, exists=result)
+        return result
+
+    def _set_existence_cache(self, path: str, exists: bool):
+        self._set_cache(
+            cache=self._existence_cache,
+            path=path,
+            value=exists,
+            ttl=self.EXISTENCE_CACHE_TTL,
+            max_size=self.EXISTENCE_CACHE_MAX_SIZE)
+
+    def _set_cache(self, cache: collections.OrderedDict, path: str, value, ttl: float, max_size: int):
+        """
+        cache the value for the path, and remove expired entries and the oldest ones over ``max_size``.
+
+        Args:
+            cache: OrderedDict of path -> (cached time, value)
+            path: Azure Blob path URL format
+            value: value to cache
+            ttl: seconds to keep the value
+            max_size: number of paths to keep
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cache.pop(path, None)
+            cache[path] = (now, value)
+            # entries are ordered by the cached time, so that expired ones are at the head
+            while cache and (len(cache) > max_size or now - next(iter(cache.values()))[0] >= ttl):
+                cache.popitem(last=False)
+
+    def invalidate(self, path: str):
+        """
+        remove cached results of ``exists()`` and ``info()`` for the path.
+        The cache is invalidated automatically when the file is written or removed via the instance.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+
+        Returns:
+            None
+        """
+        self._existence_cache.pop(path, None)
+        self._info_cache.pop(path, None)
+
+    def prewarm_container(self, path: str) -> int:
+        """
+        list files under the path at once, and cache them as existing files for ``exists()``.
+        Use it before checking many files in the same folder, such as ``cp()`` without ``overwrite``.
+        At most ``EXISTENCE_CACHE_MAX_SIZE`` files are cached, and listing stops there.
+
+        Args:
+            path: Azure Blob path URL format, ex: https://testazfs.blob.core.windows.net/test_container
+
+        Returns:
+            number of cached files
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> folder_path = "https://testazfs.blob.core.windows.net/test_container"
+            >>> azc.prewarm_container(folder_path)
+            3
+            >>> azc.exists(f"{folder_path}/test1.csv")
+            True
+
+        """
+        cached_count = 0
+        for file_path in self.ils(path=path, attach_prefix=True):
+            # directories end with `/`
+            if not file_path.endswith("/"):
+                self._set_existence_cache(path=file_path, exists=True)
+                cached_count += 1
+                if cached_count >= self.EXISTENCE_CACHE_MAX_SIZE:
+                    break
+        return cached_count
 
     def ls(self, path: str, attach_prefix: bool = False) -> list:
         """
@@ -529,18 +779,44 @@ class AzFileClient:
             ]
 
         """
-        _, account_kind, _, file_path = BlobPathDecoder(path).get_with_url()
-        file_list = self._client.get_client(account_kind=account_kind).ls(path=path, file_path=file_path)
+        return list(self.ils(path=path, attach_prefix=attach_prefix))
+
+    def ils(self, path: str, attach_prefix: bool = False) -> Iterator[str]:
+        """
+        iterator version of ``ls()``, which yields each blob file instead of returning the list.
+        Only files and folders directly under the path are listed server-side.
+
+        Args:
+            path: Azure Blob path URL format, ex: https://testazfs.blob.core.windows.net/test_container
+            attach_prefix: yield full_path if True, yield only name
+
+        Returns:
+            iterator of azure blob files
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container"
+            >>> for file_name in azc.ils(csv_path):
+            ...     print(file_name)
+            test1.csv
+            test2.csv
+
+        """
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(path)
         if account_kind in ["dfs", "blob"]:
-            file_name_list = ls_filter(file_path_list=file_list, file_path=file_path)
-            if attach_prefix:
-                path = path if path.endswith("/") else f"{path}/"
-                file_full_path_list = [f"{path}{f}" for f in file_name_list]
-                return file_full_path_list
-            else:
-                return file_name_list
+            if file_path != "" and not file_path.endswith("/"):
+                file_path = f"{file_path}/"
+            # the server lists only files and folders directly under the `file_path`,
+            # so no more filtering is required except for removing the `file_path`
+            file_list = self._client.get_client(account_kind=account_kind).ls(
+                path=path, file_path=file_path, delimiter="/")
+            prefix = path if path.endswith("/") else path + "/"
+            for f in file_list:
+                file_name = f[len(file_path):]
+                yield prefix + file_name if attach_prefix else file_name
         elif account_kind in ["queue"]:
-            return file_list
+            yield from self._client.get_client(account_kind=account_kind).ls(path=path, file_path=file_path)
 
     def cp(self, src_path: str, dst_path: str, overwrite=False) -> bool:
         """
@@ -560,10 +836,10 @@ class AzFileClient:
             raise AzfsInputError("src_path and dst_path must be different")
         if (not overwrite) and self.exists(dst_path):
             raise AzfsInputError(f"{dst_path} is already exists. Please set `overwrite=True`.")
-        data = self._get(path=src_path)
-        if type(data) is io.BytesIO:
-            self._put(path=dst_path, data=data.read())
-        elif type(data) is bytes:
+        # copy the data as it is, without decompressing
+        data = self._get(path=src_path, raw=True)
+        # file-like object is uploaded as a stream, without reading it into bytes
+        if hasattr(data, "read") or isinstance(data, (bytes, bytearray, memoryview)):
             self._put(path=dst_path, data=data)
         return True
 
@@ -578,13 +854,15 @@ class AzFileClient:
             True if target file is correctly removed.
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
+        self.invalidate(path=path)
         return self._client.get_client(account_kind=account_kind).rm(path=path)
 
     def info(self, path: str) -> dict:
         """
         get file properties, such as
         ``name``,  ``creation_time``, ``last_modified_time``, ``size``, ``content_hash(md5)``.
+        The properties are cached for ``INFO_CACHE_TTL`` seconds.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
@@ -608,7 +886,10 @@ class AzFileClient:
             }
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        cached = self._info_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < self.INFO_CACHE_TTL:
+            return dict(cached[1])
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
         # get info from blob or data-lake storage
         data = self._client.get_client(account_kind=account_kind).info(path=path)
 
@@ -624,7 +905,7 @@ class AzFileClient:
             # blob and data-lake storage have `content_settings`,
             # and its value of the `content_type` must not be None
             data_type = "file"
-        return {
+        info = {
             "name": data.get("name", ""),
             "size": data.get("size", ""),
             "creation_time": data.get("creation_time", ""),
@@ -633,6 +914,9 @@ class AzFileClient:
             "content_type": content_settings.get("content_type", ""),
             "type": data_type
         }
+        self._set_cache(
+            cache=self._info_cache, path=path, value=info, ttl=self.INFO_CACHE_TTL, max_size=self.INFO_CACHE_MAX_SIZE)
+        return dict(info)
 
     def checksum(self, path: str) -> str:
         """
@@ -746,7 +1030,7 @@ class AzFileClient:
         """
         if "*" not in pattern_path:
             raise AzfsInputError("no any `*` in the `pattern_path`")
-        url, account_kind, container_name, file_path = BlobPathDecoder(pattern_path).get_with_url()
+        url, account_kind, container_name, file_path = BlobPathDecoder.decode_with_url(pattern_path)
 
         acceptable_folder_pattern = r"(?P<root_folder>[^\*]+)/(?P<folders>.*)"
         result = re.match(acceptable_folder_pattern, file_path)
@@ -762,21 +1046,11 @@ class AzFileClient:
         if account_kind in ["dfs", "blob"]:
             file_list = self._client.get_client(account_kind=account_kind).ls(path=base_path, file_path=root_folder)
 
-            # to escape special chars for regular-expression
-            def _escape(input_str: str) -> str:
-                special_chars = ["(", ")", "[", "]"]
-                for c in special_chars:
-                    input_str = input_str.replace(c, f"\\{c}")
-                return input_str
-
-            escaped_pattern_path = _escape(pattern_path)
-            # fix pattern_path, in order to avoid matching `/`
-            replace_pattern_path = escaped_pattern_path.replace('*', '([^/])*?')
-            pattern = re.compile(f"{replace_pattern_path}$")
-            file_full_path_list = [f"{base_path}{f}" for f in file_list]
-            # filter with pattern.match
-            matched_full_path_list = [f for f in file_full_path_list if pattern.match(f)]
-            return matched_full_path_list
+            # files not starting with the literal prefix never match, so skip them before pattern.match
+            literal_prefix = file_path.split("*", 1)[0]
+            pattern = _compile_glob_pattern(file_path)
+            matched_file_list = [f for f in file_list if f.startswith(literal_prefix) and pattern.match(f)]
+            return [f"{base_path}{f}" for f in matched_file_list]
         elif account_kind in ["queue"]:
             raise NotImplementedError
 
@@ -786,6 +1060,7 @@ class AzFileClient:
             path: Union[str, List[str]] = None,
             use_mp: bool = False,
             cpu_count: Optional[int] = None,
+            max_workers: Optional[int] = None,
             file_format: str = "csv") -> DataFrameReader:
         """
         read csv, parquet, picke files in Azure Blob, like PySpark-method.
@@ -794,6 +1069,7 @@ class AzFileClient:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             use_mp: Default, False
             cpu_count: Default, as same as mp.cpu_count()
+            max_workers: number of threads to read files when ``use_mp`` is False. Default, min(32, number of files)
             file_format: determined by which function you call
 
         Returns:
@@ -816,6 +1092,8 @@ class AzFileClient:
             >>> df = azc.read().csv(blob_path_pattern)
             # you can use multiprocessing with `use_mp` argument
             >>> df = azc.read(use_mp=True).csv(blob_path_pattern)
+            # without multiprocessing, files are read with threads, and the number can be set by `max_workers`
+            >>> df = azc.read(max_workers=4).csv(blob_path_pattern)
             # if you want to filter or apply some method, you can use your defined function as below
             >>> def filter_function(_df: pd.DataFrame, _id: str) -> pd.DataFrame:
             ...     return _df[_df['id'] == _id]
@@ -829,9 +1107,16 @@ class AzFileClient:
             path=path,
             use_mp=use_mp,
             cpu_count=cpu_count,
+            max_workers=max_workers,
             file_format=file_format)
 
-    def _get(self, path: str, offset: int = None, length: int = None, **kwargs) -> Union[bytes, str, io.BytesIO, dict]:
+    def _get(
+            self,
+            path: str,
+            offset: int = None,
+            length: int = None,
+            raw: bool = False,
+            **kwargs) -> Union[bytes, str, io.BytesIO, gzip.GzipFile, dict]:
         """
         get data from Azure Blob Storage.
 
@@ -839,6 +1124,7 @@ class AzFileClient:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             offset:
             length:
+            raw: if True, return the downloaded data as it is, without wrapping with ``io.BytesIO`` or decompressing.
             **kwargs:
 
         Returns:
@@ -854,19 +1140,22 @@ class AzFileClient:
             >>> data = azc.download(path=csv_path)
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
 
         file_bytes = self._client.get_client(
             account_kind=account_kind).get(path=path, offset=offset, length=length, **kwargs)
-        # gzip圧縮ファイルは一旦ここで展開
-        if path.endswith(".gz"):
-            file_bytes = gzip.decompress(file_bytes)
+        if raw:
+            return file_bytes
 
-        if type(file_bytes) is bytes:
+        if isinstance(file_bytes, (bytes, bytearray, memoryview)):
             file_to_read = io.BytesIO(file_bytes)
         else:
             file_to_read = file_bytes
 
+        # gzip圧縮ファイルは読み込み時に逐次展開
+        if is_gzip_compressed(path=path, data=file_bytes):
+            file_to_read = decompress_stream(file_to_read, compression="gzip")
+
         return file_to_read
 
     def read_line_iter(self, path: str) -> iter:
@@ -887,10 +1176,34 @@ class AzFileClient:
             ...     print(l.decode("utf-8"))
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
         return TextReader(client=self._client.get_client(account_kind=account_kind), path=path)
 
-    def read_csv_chunk(self, path: str, chunk_size: int) -> pd.DataFrame:
+    def read_bytes_iter(self, path: str, chunk_size: int = 4 * 2 ** 20) -> Iterator[bytes]:
+        """
+        To read file in each bytes-chunk with iterator.
+        Unlike ``read_line_iter()``, line terminators are kept in the chunk.
+
+        Args:
+            path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
+            chunk_size: initial bytes length to download at once.
+                The length grows up to 16MiB while the next chunk is downloaded in background.
+
+        Returns:
+            get data of the path as iterator
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> csv_path = "https://testazfs.blob.core.windows.net/test_container/test1.csv"
+            >>> for b in azc.read_bytes_iter(path=csv_path)
+            ...     print(b.decode("utf-8"))
+
+        """
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
+        return ByteReader(client=self._client.get_client(account_kind=account_kind), path=path, length=chunk_size)
+
+    def read_csv_chunk(self, path: str, chunk_size: int, **kwargs) -> pd.DataFrame:
         """
         !WARNING! the method may differ from current version in the future update.
         Currently, only support for csv.
@@ -898,10 +1211,10 @@ class AzFileClient:
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             chunk_size: pandas-DataFrame index length to read.
+            **kwargs: keywords to put pd.read_csv(), such as ``header``, ``encoding``.
 
         Returns:
-            first time: len(df.index) is `chunk_size - 1`
-            second time or later: len(df.index) is `chunk_size`
+            pd.DataFrame, whose len(df.index) is `chunk_size` except for the last one
 
         Examples:
             >>> import azfs
@@ -916,28 +1229,10 @@ class AzFileClient:
             The name or the arguments may differ from current version in the future update.
         """
         warnings.warn(warning_message, FutureWarning)
-        initial_line = ""
-        byte_list = []
-
-        for idx, l in enumerate(self.read_line_iter(path=path)):
-            div_idx = idx % chunk_size
-            if idx == 0:
-                initial_line = l
-                byte_list.append(initial_line)
-            else:
-                byte_list.append(l)
-            if div_idx + 1 == chunk_size:
-                file_to_read = (b"\n".join(byte_list))
-                file_to_io_read = io.BytesIO(file_to_read)
-                df = pd.read_csv(file_to_io_read)
-                yield df
-
-                byte_list = [initial_line]
-        # make remainder DataFrame after the for-loop
-        file_to_read = (b"\n".join(byte_list))
-        file_to_io_read = io.BytesIO(file_to_read)
-        df = pd.read_csv(file_to_io_read)
-        yield df
+        # pandas parses the header once, and splits the lines into chunks by itself
+        file_to_read = io.BufferedReader(ByteReaderIO(self.read_bytes_iter(path=path)))
+        for df in pd.read_csv(file_to_read, chunksize=chunk_size, **kwargs):
+            yield df
 
     @_az_context_manager.register(_as="read_csv_az", _to=pd)
     def read_csv(self, path: str, **kwargs) -> pd.DataFrame:
@@ -948,6 +1243,8 @@ class AzFileClient:
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             **kwargs: keywords to put df.read_csv(), such as ``header``, ``encoding``.
+                ``compression`` is required to read files compressed other than ``gzip``,
+                and ``compression="zstd"`` requires pandas>=1.4.
 
         Returns:
             pd.DataFrame
@@ -1000,7 +1297,7 @@ class AzFileClient:
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.pkl``
-            compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+            compression: acceptable keywords are: gzip, bz2, xz, zstd, lz4. gzip is default value.
 
         Returns:
             pd.DataFrame
@@ -1019,14 +1316,8 @@ class AzFileClient:
             >>>     df = pd.read_pickle_az(pkl_path, compression="bz2")
 
         """
-        file_to_read = self._get(path).read()
-        if compression == "gzip":
-            file_to_read = gzip.decompress(file_to_read)
-        elif compression == "bz2":
-            file_to_read = bz2.decompress(file_to_read)
-        elif compression == "xz":
-            file_to_read = lzma.decompress(file_to_read)
-        return pd.DataFrame(pickle.loads(file_to_read))
+        file_to_read = self._get(path)
+        return load_pickle_stream(file_to_read, compression=compression)
 
     @_az_context_manager.register(_as="read_parquet_az", _to=pd)
     def read_parquet(self, path: str) -> pd.DataFrame:
@@ -1050,17 +1341,17 @@ class AzFileClient:
 
 
         """
-        import pyarrow.parquet as pq
-        data = self._get(path=path)
-        return pq.read_table(data).to_pandas()
+        data = self._get(path=path, raw=True)
+        return load_parquet_bytes(path=path, data=data)
 
-    def _put(self, path: str, data) -> bool:
+    def _put(self, path: str, data, **kwargs) -> bool:
         """
         upload data to blob or data_lake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``
             data: some data to upload.
+            **kwargs: ``max_concurrency`` and ``chunk_size`` are acceptable.
 
         Returns:
             True if correctly uploaded
@@ -1075,17 +1366,131 @@ class AzFileClient:
             >>> _data = azc.upload(path=csv_path)
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
-        return self._client.get_client(account_kind=account_kind).put(path=path, data=data)
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
+        result = self._client.get_client(account_kind=account_kind).put(path=path, data=data, **kwargs)
+        self.invalidate(path=path)
+        self._set_existence_cache(path=path, exists=True)
+        return result
+
+    def get_many(self, path_list: List[str], max_workers: Optional[int] = None) -> List[bytes]:
+        """
+        download many files in parallel threads.
+        Use ``AsyncAzFileClient.get_many()`` to download on an event loop.
+
+        Args:
+            path_list: list of Azure Blob path URL format
+            max_workers: number of threads. ``min(32, len(path_list))`` by default.
+
+        Returns:
+            list of bytes, in the same order as the ``path_list``
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> path_list = [
+            ...     "https://testazfs.blob.core.windows.net/test_container/test1.csv",
+            ...     "https://testazfs.blob.core.windows.net/test_container/test2.csv"
+            ... ]
+            >>> data_list = azc.get_many(path_list)
+
+        """
+        if not path_list:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(path_list))) as executor:
+            return list(executor.map(partial(self._get, raw=True), path_list))
+
+    def put_many(self, path_data_dict: Dict[str, Any], max_workers: Optional[int] = None) -> bool:
+        """
+        upload many files in parallel threads.
+        Use ``AsyncAzFileClient.put_many()`` to upload on an event loop.
+
+        Args:
+            path_data_dict: dict of Azure Blob path URL format and the data to upload
+            max_workers: number of threads. ``min(32, len(path_data_dict))`` by default.
+
+        Returns:
+            True if all files are correctly uploaded
+
+        Examples:
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> path_data_dict = {
+            ...     "https://testazfs.blob.core.windows.net/test_container/test1.json": b'{"a": 1}',
+            ...     "https://testazfs.blob.core.windows.net/test_container/test2.json": b'{"a": 2}'
+            ... }
+            >>> azc.put_many(path_data_dict)
+            True
+
+        """
+        if not path_data_dict:
+            return True
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(path_data_dict))) as executor:
+            return all(executor.map(self._put, path_data_dict.keys(), path_data_dict.values()))
+
+    @staticmethod
+    def _to_csv_buffer(df: pd.DataFrame, engine: str = "pandas", compression: Optional[str] = None, **kwargs):
+        """
+        write csv into ``io.BytesIO`` directly, without creating whole csv as ``str`` and encoding it.
+
+        Args:
+            df: pd.DataFrame to write
+            engine: ``pandas`` or ``pyarrow``.
+                ``pyarrow`` writes csv with multiple threads, and accepts only ``sep``, ``index`` and ``header``.
+                With other keywords, ``pandas`` is used instead.
+            compression: gzip, bz2, xz, zstd or lz4. not compressed by default.
+            **kwargs: keywords to put df.to_csv(). ``encoding`` is ``utf-8`` by default.
+
+        Returns:
+            file-like object, whose position is the head
+        """
+        kwargs.setdefault("encoding", "utf-8")
+        if engine == "pyarrow" and set(kwargs) <= {"sep", "index", "header", "encoding"} \
+                and kwargs["encoding"].lower().replace("-", "") == "utf8":
+            import pyarrow as pa
+            import pyarrow.csv as pv
+            if kwargs.get("index", True):
+                df = df.reset_index()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            write_options = pv.WriteOptions(include_header=kwargs.get("header", True), delimiter=kwargs.get("sep", ","))
+            pv.write_csv(table, sink, write_options=write_options)
+            # read the arrow buffer without copying it into bytes
+            buffer = pa.BufferReader(sink.getvalue())
+        else:
+            buffer = io.BytesIO()
+            # pandas<1.2 cannot write into a binary handle, so encode through a text wrapper
+            text_buffer = io.TextIOWrapper(buffer, encoding=kwargs.pop("encoding"), newline="")
+            df.to_csv(text_buffer, **kwargs)
+            text_buffer.flush()
+            text_buffer.detach()
+            buffer.seek(0)
+        if compression is None:
+            return buffer
+
+        compressed_buffer = io.BytesIO()
+        with compress_stream(compressed_buffer, compression=compression) as f:
+            shutil.copyfileobj(buffer, f, 2 ** 20)
+        compressed_buffer.seek(0)
+        return compressed_buffer
 
     @_az_context_manager.register(_as="to_csv_az", _to=pd.DataFrame)
-    def write_csv(self, path: str, df: pd.DataFrame, **kwargs) -> bool:
+    def write_csv(
+            self,
+            path: str,
+            df: pd.DataFrame,
+            engine: str = "pandas",
+            compression: Optional[str] = None,
+            **kwargs) -> bool:
         """
         output pandas dataframe to csv file in Datalake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.csv``.
             df: pd.DataFrame to upload.
+            engine: ``pandas`` or ``pyarrow``. ``pyarrow`` is faster, and accepts only ``sep``, ``index``, ``header``.
+                The format of values, such as quotes of strings, may differ from ``pandas``.
+            compression: gzip, bz2, xz, zstd or lz4. not compressed by default.
+                ``zstd`` reduces the size to upload, and is much faster than ``gzip``.
             **kwargs: keywords to put df.to_csv(), such as ``encoding``, ``index``.
 
         Returns:
@@ -1100,18 +1505,33 @@ class AzFileClient:
             Using `with` statement, you can use `pandas`-like methods
             >>> with azc:
             >>>     df.to_csv_az(csv_path)
+            csv is written faster with `pyarrow`
+            >>> azc.write_csv(path=csv_path, df=df, engine="pyarrow", index=False)
+            compress csv with `zstandard`, and read it with the same compression (pandas>=1.4)
+            >>> azc.write_csv(path=f"{csv_path}.zst", df=df, compression="zstd")
+            >>> df = azc.read_csv(path=f"{csv_path}.zst", compression="zstd")
+            with older pandas, decompress the file by `azfs.utils.decompress_stream()`
+            >>> from azfs.utils import decompress_stream
+            >>> df = pd.read_csv(decompress_stream(azc.get(path=f"{csv_path}.zst"), compression="zstd"))
         """
-        csv_str = df.to_csv(**kwargs).encode("utf-8")
-        return self._put(path=path, data=csv_str)
+        return self._put(path=path, data=self._to_csv_buffer(df, engine=engine, compression=compression, **kwargs))
 
     @_az_context_manager.register(_as="to_table_az", _to=pd.DataFrame)
-    def write_table(self, path: str, df: pd.DataFrame, **kwargs) -> bool:
+    def write_table(
+            self,
+            path: str,
+            df: pd.DataFrame,
+            engine: str = "pandas",
+            compression: Optional[str] = None,
+            **kwargs) -> bool:
         """
         output pandas dataframe to tsv file in Datalake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.tsv``.
             df: pd.DataFrame to upload.
+            engine: ``pandas`` or ``pyarrow``, see ``write_csv()``.
+            compression: gzip, bz2, xz, zstd or lz4, see ``write_csv()``.
             **kwargs: keywords to put df.to_csv(), such as ``encoding``, ``index``.
 
         Returns:
@@ -1127,18 +1547,29 @@ class AzFileClient:
             >>> with azc:
             >>>     df.to_table_az(tsv_path)
         """
-        table_str = df.to_csv(sep="\t", **kwargs).encode("utf-8")
-        return self._put(path=path, data=table_str)
+        return self._put(
+            path=path,
+            data=self._to_csv_buffer(df, engine=engine, compression=compression, sep="\t", **kwargs))
 
     @_az_context_manager.register(_as="to_pickle_az", _to=pd.DataFrame)
-    def write_pickle(self, path: str, df: pd.DataFrame, compression="gzip") -> bool:
+    def write_pickle(
+            self,
+            path: str,
+            df: pd.DataFrame,
+            compression="gzip",
+            protocol: int = pickle.DEFAULT_PROTOCOL,
+            out_of_band: bool = False) -> bool:
         """
         output pandas dataframe to tsv file in Datalake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.pkl``
             df: pd.DataFrame to upload.
-            compression: acceptable keywords are: gzip, bz2, xz. gzip is default value.
+            compression: acceptable keywords are: gzip, bz2, xz, zstd, lz4. gzip is default value.
+            protocol: pickle protocol. ``pickle.DEFAULT_PROTOCOL`` is default value, readable in every supported Python.
+                set ``protocol=5`` (Python 3.8+) to serialize numpy arrays in pd.DataFrame without extra copies.
+            out_of_band: if True, numpy arrays are framed next to the pickle with protocol 5, and uploaded without copy
+                when ``compression=None``. the file can be read only by ``read_pickle()``.
 
         Returns:
             pd.DataFrame
@@ -1149,45 +1580,67 @@ class AzFileClient:
             >>> pkl_path = "https://testazfs.blob.core.windows.net/test_container/test1.pkl"
             you can read and write csv file in azure blob storage
             >>> azc.write_pickle(path=pkl_path, df=df)
+            set protocol 5 explicitly when the file is read only in Python 3.8+
+            >>> azc.write_pickle(path=pkl_path, df=df, protocol=5)
             Using `with` statement, you can use `pandas`-like methods
             >>> with azc:
             >>>     df.to_pickle_az(pkl_path)
             you can use difference compression
             >>> with azc:
             >>>     df.to_pickle_az(pkl_path, compression="bz2")
-
-        """
-        serialized_data = pickle.dumps(df)
-        if compression == "gzip":
-            serialized_data = gzip.compress(serialized_data)
-        elif compression == "bz2":
-            serialized_data = bz2.compress(serialized_data)
-        elif compression == "xz":
-            serialized_data = lzma.compress(serialized_data)
-        return self._put(path=path, data=serialized_data)
+            zstd is faster than gzip with similar compression ratio, if `zstandard` is installed
+            >>> azc.write_pickle(path=pkl_path, df=df, compression="zstd")
+            large numeric pd.DataFrame can be uploaded without copying its arrays
+            >>> azc.write_pickle(path=pkl_path, df=df, compression=None, out_of_band=True)
+
+        """
+        if compression is None:
+            if out_of_band:
+                return self._put(path=path, data=MemoryViewIO(*pickle_dumps_out_of_band(df)))
+            return self._put(path=path, data=pickle.dumps(df, protocol=protocol))
+
+        # compress while pickling, without holding whole uncompressed bytes
+        file_to_write = io.BytesIO()
+        with compress_stream(file_to_write, compression=compression) as f:
+            if out_of_band:
+                f.writelines(pickle_dumps_out_of_band(df))
+            else:
+                pickle.dump(df, f, protocol=protocol)
+        file_to_write.seek(0)
+        return self._put(path=path, data=file_to_write)
 
     @_az_context_manager.register(_as="to_parquet_az", _to=pd.DataFrame)
-    def write_parquet(self, path: str, table) -> bool:
+    def write_parquet(self, path: str, df, compression: Optional[str] = "zstd") -> bool:
         """
-        When implementation of AzFileSystem is done, the function will be implemented.
-
+        output pandas dataframe or pyarrow table to parquet file in Datalake storage.
 
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test.parquet``
-            table: parquet table
+            df: pd.DataFrame or pyarrow.Table to upload.
+            compression: compression of pyarrow.parquet.write_table(), such as ``snappy``, ``gzip``, ``zstd``.
+                zstd is default value.
 
         Returns:
             True: if successfully uploaded
 
         Examples:
-            >>> from azfs import AzFileSystem
-            >>> import pyarrow.parquet as pq
-            >>> fs = AzFileSystem()
-            >>> with fs.open("azure_path", "wb") as f:
-            ...     pq.write_table(table, f)
+            >>> import azfs
+            >>> azc = azfs.AzFileClient()
+            >>> parquet_path = "https://testazfs.blob.core.windows.net/test_container/test1.parquet"
+            you can read and write parquet file in azure blob storage
+            >>> azc.write_parquet(path=parquet_path, df=df)
+            Using `with` statement, you can use `pandas`-like methods
+            >>> with azc:
+            >>>     df.to_parquet_az(parquet_path)
 
         """
-        raise NotImplementedError
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df) if isinstance(df, pd.DataFrame) else df
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink, compression=compression)
+        # read the arrow buffer without copying it into bytes
+        return self._put(path=path, data=pa.BufferReader(sink.getvalue()))
 
     def read_json(self, path: str, **kwargs) -> dict:
         """
@@ -1196,6 +1649,7 @@ class AzFileClient:
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.json``
             **kwargs: keywords to put json.loads(), such as ``parse_float``.
+                ``use_orjson=True`` parses with ``orjson`` if installed, see ``azfs.utils.json_loads()``.
 
         Returns:
             dict
@@ -1208,10 +1662,14 @@ class AzFileClient:
             >>> azc.read_json(path=json_path)
 
         """
-        file_bytes = self._get(path)
-        if type(file_bytes) is io.BytesIO:
+        # parse the downloaded bytes directly, without copying them via io.BytesIO
+        file_bytes = self._get(path, raw=True)
+        if hasattr(file_bytes, "getbuffer"):
+            # io.BytesIO shares its memory with the view
+            file_bytes = file_bytes.getbuffer()
+        elif hasattr(file_bytes, "read"):
             file_bytes = file_bytes.read()
-        return json.loads(file_bytes, **kwargs)
+        return load_json_bytes(path=path, data=file_bytes, **kwargs)
 
     def write_json(self, path: str, data: dict, **kwargs) -> bool:
         """
@@ -1220,7 +1678,8 @@ class AzFileClient:
         Args:
             path: Azure Blob path URL format, ex: ``https://testazfs.blob.core.windows.net/test_container/test1.json``
             data: dict to upload
-            **kwargs: keywords to put json.loads(), such as ``indent``.
+            **kwargs: keywords to put json.dumps(), such as ``indent``.
+                ``use_orjson=True`` serializes with ``orjson`` if installed, see ``azfs.utils.json_dumps()``.
 
         Returns:
             True if correctly uploaded
@@ -1233,8 +1692,8 @@ class AzFileClient:
             >>> azc.write_json(path=json_path, data={"": ""})
 
         """
-        # encode with UTF-8 to fully upload data including not ascii character
-        return self._put(path=path, data=json.dumps(data, **kwargs).encode("utf-8"))
+        # UTF-8 encoded bytes are uploaded as it is, so that the sdk does not encode it again
+        return self._put(path=path, data=json_dumps(data, **kwargs))
 
     # import decorator
     def import_decorator(
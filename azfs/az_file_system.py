@@ -68,7 +68,7 @@ class AzFileSystem(AbstractFileSystem):
         Returns:
 
         """
-        _, account_kind, _, _ = BlobPathDecoder(path).get_with_url()
+        _, account_kind, _, _ = BlobPathDecoder.decode_with_url(path)
         # get info from blob or data-lake storage
         data = self.az_client.get_client(account_kind=account_kind).info(path=path)
 
@@ -107,7 +107,7 @@ class AzFileSystem(AbstractFileSystem):
         Returns:
 
         """
-        _, account_kind, _, file_path = BlobPathDecoder(path).get_with_url()
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(path)
         file_list = self.az_client.get_client(account_kind=account_kind).ls(path=path, file_path=file_path)
         if account_kind in ["dfs", "blob"]:
             file_name_list = ls_filter(file_path_list=file_list, file_path=file_path)
@@ -230,7 +230,7 @@ class AzFile(AbstractBufferedFile):
         """
         logger.debug("upload chunk")
         # decode azure path
-        _, account_kind, _, file_path = BlobPathDecoder(self.path).get_with_url()
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(self.path)
 
         # may not yet have been initialized, may need to call _initialize_upload
         if self.autocommit and not self.append_block and final and self.tell() < self.blocksize:
@@ -275,7 +275,7 @@ class AzFile(AbstractBufferedFile):
     def commit(self):
         logger.debug("commit")
         # decode azure path
-        _, account_kind, _, file_path = BlobPathDecoder(self.path).get_with_url()
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(self.path)
 
         # read data
         if self.autocommit and not self.append_block and self.tell() < self.blocksize:
@@ -296,7 +296,7 @@ class AzFile(AbstractBufferedFile):
         if self.autocommit and not self.append_block and self.tell() < self.blocksize:
             # only happens when closing small file, use on-shot PUT
             return
-        _, account_kind, _, file_path = BlobPathDecoder(self.path).get_with_url()
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(self.path)
         self.fs.az_client.get_client(account_kind=account_kind).create(path=self.path)
 
     def _fetch_range(self, start, end):
@@ -310,6 +310,6 @@ class AzFile(AbstractBufferedFile):
         Returns:
 
         """
-        _, account_kind, _, file_path = BlobPathDecoder(self.path).get_with_url()
+        _, account_kind, _, file_path = BlobPathDecoder.decode_with_url(self.path)
         return self.fs.az_client.get_client(
             account_kind=account_kind).get(path=self.path, offset=start, length=end-start)
@@ -1,17 +1,29 @@
-import importlib
-import sys
+import importlib.util
+import os
 
 
 class CliFactory:
 
     def __init__(self, target_file_dir):
         self.target_file_dir = target_file_dir
+        # modules loaded once for each file name, without touching `sys.path` and `sys.modules`
+        self._app_dict = {}
+
+    def _load_app(self, target_file_name: str):
+        app = self._app_dict.get(target_file_name)
+        if app is not None:
+            return app
+        spec = importlib.util.spec_from_file_location(
+            f"azfs_cli_app_{target_file_name}",
+            os.path.join(self.target_file_dir, f"{target_file_name}.py"))
+        app = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(app)
+        self._app_dict[target_file_name] = app
+        return app
 
     def load_export_decorator(self, target_file_name: str):
-        if self.target_file_dir not in sys.path:
-            sys.path.insert(0, self.target_file_dir)
         try:
-            app = importlib.import_module(target_file_name)
+            app = self._load_app(target_file_name)
             export_decorator = getattr(app, 'export_decorator')
         except SyntaxError as e:
             message = (
@@ -1,4 +1,7 @@
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+import io
+import threading
+from typing import Iterator, Union
 from .blob_client import AzBlobClient
 from .datalake_client import AzDataLakeClient
 from .queue_client import AzQueueClient
@@ -43,6 +46,9 @@ class AzfsClient(AbstractClient):
     def __init__(self, credential, connection_string):
         self._credential = credential
         self._connection_string = connection_string
+        # each client keeps its service clients and http session, so reuse the client
+        self._client_dict = {}
+        self._client_lock = threading.Lock()
 
     def get_client(self, account_kind: str) -> Union[AzBlobClient, AzDataLakeClient, AzQueueClient]:
         """
@@ -58,7 +64,26 @@ class AzfsClient(AbstractClient):
             >>> azfs_client = AzfsClient(credential="...")
             >>> AzBlobClient = azfs_client.get_client("blob")
         """
-        return self.CLIENTS[account_kind](credential=self._credential, connection_string=self._connection_string)
+        client = self._client_dict.get(account_kind)
+        if client is None:
+            with self._client_lock:
+                client = self._client_dict.get(account_kind)
+                if client is None:
+                    client = self.CLIENTS[account_kind](
+                        credential=self._credential, connection_string=self._connection_string)
+                    self._client_dict[account_kind] = client
+        return client
+
+    def close(self):
+        """
+        close http sessions of all clients
+
+        Returns:
+            None
+        """
+        for client in self._client_dict.values():
+            client.close()
+        self._client_dict.clear()
 
 
 class TextReader:
@@ -66,18 +91,10 @@ class TextReader:
     The class is to provide line-based reading iterator.
     Reading file should be ends-with "\n", otherwise last line will be ignored.
     """
-    def __init__(self, client, path: str, offset: int = 0, length: int = 2 ** 14, size: int = None):
-        self._client = client
-        self._size = client.info(path).get("size", size)
+    def __init__(self, client, path: str, offset: int = 0, length: int = 4 * 2 ** 20, size: int = None):
+        self._byte_reader = ByteReader(client=client, path=path, offset=offset, length=length, size=size)
         self._rest_part = b""
-        self._offset = offset
-        self._length = length
-        self._read_length = length
-        self._iter = 0
-        self._path = path
-        self._byte_text = None
-        self._current_chunk_lines = None
-        self._current_chunk_lines_length = None
+        self._current_chunk_lines = []
         self._line_counter = 0
 
     def get_chunk(self) -> bytes:
@@ -87,20 +104,12 @@ class TextReader:
         Returns:
             AzureStorageFile-byte [start: end]
         """
-        if self._read_length < 0:
-            raise StopIteration()
-        rtn = self._rest_part + self._client.get(path=self._path, offset=self._offset, length=self._length)
-        self._iter += 1
-        self._offset = self._iter * self._length
-        self._read_length = min(self._length, self._size - self._offset)
-        return rtn
+        return self._rest_part + next(self._byte_reader)
 
     def next_line(self) -> bytes:
-        if self._byte_text is None or self._line_counter >= self._current_chunk_lines_length:
-            self._byte_text = self.get_chunk()
-            chunk_lines = self._byte_text.split("\n".encode('utf-8'))
+        while self._line_counter >= len(self._current_chunk_lines):
+            chunk_lines = self.get_chunk().split(b"\n")
             self._current_chunk_lines = chunk_lines[:-1]
-            self._current_chunk_lines_length = len(self._current_chunk_lines)
             self._line_counter = 0
             self._rest_part = chunk_lines[-1]
         current_line = self._current_chunk_lines[self._line_counter]
@@ -111,7 +120,78 @@ class TextReader:
         return self
 
     def __next__(self) -> bytes:
-        try:
-            return self.next_line()
-        except StopIteration:
-            raise
+        return self.next_line()
+
+
+class ByteReader:
+    """
+    The class is to provide bytes-chunk-based reading iterator.
+    Each chunk is yielded as it is downloaded, so line terminators are kept.
+
+    The next chunk is downloaded in background while the current chunk is consumed.
+    The chunk length is doubled up to ``MAX_LENGTH`` when the consumer waits for the download,
+    and halved down to the initial length when the download is already done.
+    """
+    MAX_LENGTH = 16 * 2 ** 20
+
+    def __init__(self, client, path: str, offset: int = 0, length: int = 4 * 2 ** 20, size: int = None):
+        self._client = client
+        self._size = client.info(path).get("size", size)
+        self._offset = offset
+        self._min_length = length
+        self._length = length
+        self._path = path
+        self._executor = None
+        self._future = None
+
+    def _prefetch(self):
+        if self._offset >= self._size:
+            self._future = None
+            return
+        read_length = min(self._length, self._size - self._offset)
+        self._future = self._executor.submit(
+            self._client.get, path=self._path, offset=self._offset, length=read_length)
+        self._offset += read_length
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetch()
+        if self._future is None:
+            self._executor.shutdown(wait=False)
+            raise StopIteration()
+        if self._future.done():
+            self._length = max(self._length // 2, self._min_length)
+        else:
+            self._length = min(self._length * 2, max(self.MAX_LENGTH, self._min_length))
+        chunk = self._future.result()
+        self._prefetch()
+        return chunk
+
+
+class ByteReaderIO(io.RawIOBase):
+    """
+    The class is to provide file-like object based on an iterator of bytes, such as ``ByteReader``,
+    in order to pass the data to parsers such as ``pd.read_csv`` without joining them.
+    """
+    def __init__(self, byte_iter: Iterator[bytes]):
+        self._byte_iter = byte_iter
+        self._buffer = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        # fill the buffer with chunks until the requested size is reached
+        while len(self._buffer) < len(b):
+            try:
+                self._buffer += next(self._byte_iter)
+            except StopIteration:
+                break
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        del self._buffer[:size]
+        return size
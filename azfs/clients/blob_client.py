@@ -1,10 +1,15 @@
-from typing import Union
+import itertools
+from operator import attrgetter
+from typing import IO, Optional, Union
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobClient, ContainerClient, BlobServiceClient
+from azfs.utils import MemoryViewIO
 from .client_interface import ClientInterface
 
 
 class AzBlobClient(ClientInterface):
+    # maximum number of blobs returned in one listing request
+    LS_RESULTS_PER_PAGE = 5000
 
     def _get_service_client_from_credential(
             self,
@@ -20,12 +25,21 @@ class AzBlobClient(ClientInterface):
         Returns:
             BlobServiceClient
         """
-        return BlobServiceClient(account_url=account_url, credential=credential)
+        return BlobServiceClient(
+            account_url=account_url,
+            credential=credential,
+            transport=self.transport,
+            max_chunk_get_size=self.MAX_CHUNK_GET_SIZE,
+            max_block_size=self.MAX_CHUNK_PUT_SIZE)
 
     def _get_service_client_from_connection_string(
             self,
             connection_string: str):
-        return BlobServiceClient.from_connection_string(conn_str=connection_string)
+        return BlobServiceClient.from_connection_string(
+            conn_str=connection_string,
+            transport=self.transport,
+            max_chunk_get_size=self.MAX_CHUNK_GET_SIZE,
+            max_block_size=self.MAX_CHUNK_PUT_SIZE)
 
     def _get_file_client(
             self,
@@ -72,20 +86,54 @@ class AzBlobClient(ClientInterface):
         )
         return container_client
 
-    def _ls(self, path: str, file_path: str):
-        blob_list = \
-            [f.name for f in self.get_container_client_from_path(path=path).list_blobs(name_starts_with=file_path)]
+    def _ls(self, path: str, file_path: str, delimiter: Optional[str] = None):
+        container_client = self.get_container_client_from_path(path=path)
+        if delimiter is None:
+            # pages are requested one after another with the continuation token, so make the pages as large as possible
+            pages = container_client.list_blobs(
+                name_starts_with=file_path,
+                results_per_page=self.LS_RESULTS_PER_PAGE).by_page()
+            blob_list = list(itertools.chain.from_iterable(map(attrgetter("name"), page) for page in pages))
+        else:
+            # folders are returned as `BlobPrefix`, whose name ends with the delimiter
+            blob_list = [f.name for f in container_client.walk_blobs(
+                name_starts_with=file_path,
+                delimiter=delimiter,
+                results_per_page=self.LS_RESULTS_PER_PAGE)]
         return blob_list
 
+    def exists_prefix(self, path: str, file_path: str) -> bool:
+        """
+        check if any blob starts with ``file_path``, with only the first page of one blob.
+
+        Args:
+            path:
+            file_path:
+
+        Returns:
+            ``True`` if any blob exists
+        """
+        container_client = self.get_container_client_from_path(path=path)
+        blob_iter = container_client.list_blobs(name_starts_with=file_path, results_per_page=1)
+        return next(iter(blob_iter), None) is not None
+
     def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
-        file_bytes = self.get_file_client_from_path(path=path).download_blob(offset=offset, length=length).readall()
+        max_concurrency = kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
+        file_bytes = self.get_file_client_from_path(path=path).download_blob(
+            offset=offset,
+            length=length,
+            max_concurrency=max_concurrency).readall()
         return file_bytes
 
-    def _put(self, path: str, data):
+    def _put(self, path: str, data: Union[bytes, str, memoryview, IO[bytes]], **kwargs):
+        if isinstance(data, memoryview):
+            data = MemoryViewIO(data)
+        # the length of bytes and file-like object, such as io.BytesIO, is checked by the sdk
+        # large data is split into blocks, and the blocks are uploaded in parallel
         self.get_file_client_from_path(path=path).upload_blob(
             data=data,
-            length=len(data),
-            overwrite=True
+            overwrite=True,
+            max_concurrency=kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
         )
         return True
 
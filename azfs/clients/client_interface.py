@@ -1,5 +1,10 @@
 from abc import abstractmethod
+import os
+import threading
 from typing import Union, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import BlobClient, ContainerClient
 from azure.storage.filedatalake import DataLakeFileClient, FileSystemClient
@@ -31,6 +36,14 @@ class ClientInterface:
     * _get
     * _put
     """
+    # number of parallel connections to download a file with ranged GET requests
+    MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+    # size of each ranged GET request
+    MAX_CHUNK_GET_SIZE = 16 * 2 ** 20
+    # size of each block or append request to upload a file in parallel
+    MAX_CHUNK_PUT_SIZE = 8 * 2 ** 20
+    # number of connections kept in the http session, larger than MAX_CONCURRENCY
+    POOL_MAXSIZE = 64
 
     def __init__(
             self,
@@ -38,6 +51,38 @@ class ClientInterface:
             connection_string: Optional[str] = None):
         self.credential = credential
         self.connection_string = connection_string
+        # service clients and http session are reused across requests
+        self._service_client_dict = {}
+        self._service_client_lock = threading.Lock()
+        self._session = None
+
+    @property
+    def transport(self) -> RequestsTransport:
+        """
+        transport sharing one http session (connection pool) with every service client.
+
+        Returns:
+            RequestsTransport
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.POOL_MAXSIZE, pool_maxsize=self.POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            self._session = session
+        return RequestsTransport(session=self._session, session_owner=False)
+
+    def close(self):
+        """
+        dispose service clients and the http session.
+        They are created again when the next request is sent.
+
+        Returns:
+            None
+        """
+        self._service_client_dict.clear()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     @abstractmethod
     def _get_service_client_from_credential(
@@ -63,10 +108,23 @@ class ClientInterface:
         raise NotImplementedError
 
     def _get_service_client_from_url(self, account_url):
-        if self.credential is not None:
-            return self._get_service_client_from_credential(account_url=account_url, credential=self.credential)
-        elif self.connection_string is not None:
-            return self._get_service_client_from_connection_string(connection_string=self.connection_string)
+        service_client = self._service_client_dict.get(account_url)
+        if service_client is not None:
+            return service_client
+
+        # files are read and written in threads, so create only one service client for each account
+        with self._service_client_lock:
+            service_client = self._service_client_dict.get(account_url)
+            if service_client is not None:
+                return service_client
+            if self.credential is not None:
+                service_client = self._get_service_client_from_credential(
+                    account_url=account_url, credential=self.credential)
+            elif self.connection_string is not None:
+                service_client = self._get_service_client_from_connection_string(
+                    connection_string=self.connection_string)
+            self._service_client_dict[account_url] = service_client
+        return service_client
 
     def get_service_client_from_url(self, account_url):
         return self._get_service_client_from_url(account_url=account_url)
@@ -81,7 +139,7 @@ class ClientInterface:
         Returns:
             Union[BlobClient, DataLakeFileClient, QueueClient]
         """
-        account_url, account_kind, file_system, file_path = BlobPathDecoder(path).get_with_url()
+        account_url, account_kind, file_system, file_path = BlobPathDecoder.decode_with_url(path)
         return self._get_file_client(
             account_url=account_url,
             file_system=file_system,
@@ -113,7 +171,7 @@ class ClientInterface:
         Returns:
             Union[ContainerClient, FileSystemClient]
         """
-        account_url, _, file_system, _ = BlobPathDecoder(path).get_with_url()
+        account_url, _, file_system, _ = BlobPathDecoder.decode_with_url(path)
         return self._get_container_client(
             account_url=account_url,
             file_system=file_system)
@@ -131,15 +189,28 @@ class ClientInterface:
         """
         raise NotImplementedError
 
-    def ls(self, path: str, file_path: str):
-        return self._ls(path=path, file_path=file_path)
+    def ls(self, path: str, file_path: str, delimiter: Optional[str] = None):
+        """
+        list files whose name starts with ``file_path``.
+
+        Args:
+            path:
+            file_path:
+            delimiter: if ``/``, only files and folders directly under ``file_path`` are listed by the server,
+                and the name of folders ends with ``/``. Otherwise, all files are listed recursively.
+
+        Returns:
+
+        """
+        return self._ls(path=path, file_path=file_path, delimiter=delimiter)
 
     @abstractmethod
-    def _ls(self, path: str, file_path: str):
+    def _ls(self, path: str, file_path: str, delimiter: Optional[str] = None):
         """
         abstract method to be implemented
         :param path:
         :param file_path:
+        :param delimiter:
         :return:
         """
         raise NotImplementedError
@@ -174,15 +245,27 @@ class ClientInterface:
         """
         raise NotImplementedError
 
-    def put(self, path: str, data):
-        return self._put(path=path, data=data)
+    def put(self, path: str, data, **kwargs):
+        """
+        upload data to Azure Blob, DataLake or Queue.
+
+        Args:
+            path:
+            data:
+            **kwargs: ``max_concurrency`` is acceptable for Blob and DataLake, and ``chunk_size`` for DataLake
+
+        Returns:
+
+        """
+        return self._put(path=path, data=data, **kwargs)
 
     @abstractmethod
-    def _put(self, path: str, data):
+    def _put(self, path: str, data, **kwargs):
         """
         abstract method to be implemented
         :param path:
         :param data:
+        :param kwargs:
         :return:
         """
         raise NotImplementedError
@@ -1,7 +1,11 @@
-import math
-from typing import Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+import io
+from typing import IO, Optional, Union
 from azure.identity import DefaultAzureCredential
 from azure.storage.filedatalake import DataLakeFileClient, FileSystemClient, DataLakeServiceClient
+from azfs.error import AzfsInputError
+from azfs.utils import MemoryViewIO
 from .client_interface import ClientInterface
 
 
@@ -21,12 +25,19 @@ class AzDataLakeClient(ClientInterface):
         Returns:
             DataLakeServiceClient
         """
-        return DataLakeServiceClient(account_url=account_url, credential=credential)
+        return DataLakeServiceClient(
+            account_url=account_url,
+            credential=credential,
+            transport=self.transport,
+            max_chunk_get_size=self.MAX_CHUNK_GET_SIZE)
 
     def _get_service_client_from_connection_string(
             self,
             connection_string: str):
-        return DataLakeServiceClient.from_connection_string(conn_str=connection_string)
+        return DataLakeServiceClient.from_connection_string(
+            conn_str=connection_string,
+            transport=self.transport,
+            max_chunk_get_size=self.MAX_CHUNK_GET_SIZE)
 
     def _get_file_client(
             self,
@@ -74,43 +85,77 @@ class AzDataLakeClient(ClientInterface):
         )
         return file_system_client
 
-    def _ls(self, path: str, file_path: str):
-        file_list = \
-            [f.name for f in self.get_container_client_from_path(path=path).get_paths(path=file_path, recursive=True)]
+    def _ls(self, path: str, file_path: str, delimiter: Optional[str] = None):
+        paths = self.get_container_client_from_path(path=path).get_paths(path=file_path, recursive=delimiter is None)
+        if delimiter is None:
+            file_list = [f.name for f in paths]
+        else:
+            # attach the delimiter to folders, as same as blob storage
+            file_list = [f"{f.name}{delimiter}" if f.is_directory else f.name for f in paths]
         return file_list
 
     def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
-        file_bytes = self.get_file_client_from_path(path).download_file(offset=offset, length=length).readall()
+        max_concurrency = kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
+        file_bytes = self.get_file_client_from_path(path).download_file(
+            offset=offset,
+            length=length,
+            max_concurrency=max_concurrency).readall()
         return file_bytes
 
-    def _put(self, path: str, data):
+    def _put(self, path: str, data: Union[bytes, str, memoryview, IO[bytes]], **kwargs):
         """
         In DataLake Storage Account, uploading the file over 100MB may raise Exception like
         `(RequestBodyTooLarge) The request body is too large and exceeds the maximum permissible limit`.
 
         So in order to avoid the exception above, data are uploaded by appending.
+        The appends are sent in parallel, at most ``max_concurrency`` at the same time, and flushed at once in the end.
 
         Args:
             path:
             data:
+            **kwargs: ``max_concurrency`` and ``chunk_size`` are acceptable
 
         Returns:
 
+        Raises:
+            AzfsInputError: when the file-like object is opened in text mode
         """
+        if isinstance(data, io.TextIOBase):
+            # `read()` returns "" at the end, so that the chunks are never terminated by b""
+            raise AzfsInputError("file-like object must be opened in binary mode, such as `open(path, 'rb')`")
         file_client = self.get_file_client_from_path(path=path)
         _ = file_client.create_file()
-        # upload data
-        data_length = len(data)
-        # 2 ** 23 = 8_388_608 ~= 10_000_000
-        upload_unit = 2 ** 23
-        append_times = math.ceil(data_length / upload_unit)
+        upload_unit = kwargs.get("chunk_size", self.MAX_CHUNK_PUT_SIZE)
+        max_concurrency = kwargs.get("max_concurrency", self.MAX_CONCURRENCY)
+        if isinstance(data, str):
+            # offsets and the length to flush are counted in bytes
+            data = data.encode("utf-8")
+        if isinstance(data, memoryview):
+            data = MemoryViewIO(data)
         # to avoid uploading limitation in one time
-        for idx in range(append_times):
-            start = idx * upload_unit
-            end = min((idx + 1) * upload_unit, data_length)
-            split_data = data[start:end]
-            # upload data
-            self.append(path=path, data=split_data, offset=start)
+        if hasattr(data, "read"):
+            # file-like object, such as io.BytesIO
+            split_data_iter = iter(partial(data.read, upload_unit), b"")
+        else:
+            split_data_iter = (data[start:start + upload_unit] for start in range(0, len(data), upload_unit))
+        start = 0
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = set()
+            for split_data in split_data_iter:
+                # hold at most `max_concurrency` chunks in memory at the same time
+                if len(futures) >= max_concurrency:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                # upload data
+                futures.add(
+                    executor.submit(file_client.append_data, data=split_data, offset=start, length=len(split_data)))
+                start += len(split_data)
+            for future in futures:
+                future.result()
+        if start > 0:
+            # write data
+            _ = file_client.flush_data(start)
         return True
 
     def _create(self, path: str) -> dict:
@@ -1,5 +1,5 @@
 import base64
-from typing import Union
+from typing import Optional, Union
 from azure.identity import DefaultAzureCredential
 from azure.storage.queue import QueueClient, QueueServiceClient
 from .client_interface import ClientInterface
@@ -21,12 +21,12 @@ class AzQueueClient(ClientInterface):
         Returns:
 
         """
-        return QueueServiceClient(account_url=account_url, credential=credential)
+        return QueueServiceClient(account_url=account_url, credential=credential, transport=self.transport)
 
     def _get_service_client_from_connection_string(
             self,
             connection_string: str):
-        return QueueServiceClient.from_connection_string(conn_str=connection_string)
+        return QueueServiceClient.from_connection_string(conn_str=connection_string, transport=self.transport)
 
     def _get_file_client(
             self,
@@ -68,7 +68,7 @@ class AzQueueClient(ClientInterface):
 
         raise NotImplementedError
 
-    def _ls(self, path: str, file_path: str):
+    def _ls(self, path: str, file_path: str, delimiter: Optional[str] = None):
         return self.get_file_client_from_path(path).peek_messages(16)
 
     def _get(self, path: str, offset: int = None, length: int = None, **kwargs):
@@ -107,7 +107,7 @@ class AzQueueClient(ClientInterface):
         except StopIteration:
             return {"status": "error", "message": "queue not found"}
 
-    def _put(self, path: str, data):
+    def _put(self, path: str, data, **kwargs):
         """
         put message in queue with base64-encoded.
 
@@ -1,11 +1,38 @@
+import bisect
+import bz2
+import functools
+import gzip
+import io
+import itertools
+import json
+import lzma
+import pickle
 import re
-from typing import Union, Tuple
+import struct
+from typing import List, Optional, Union, Tuple
+import pandas as pd
 from azfs.error import (
     AzfsInputError,
     AzfsInvalidPathError
 )
 
-__all__ = ["BlobPathDecoder", "ls_filter"]
+try:
+    # orjson is optional, and parses bytes faster than the standard json module when requested
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # isal is optional, and (de)compresses gzip several times faster than the standard zlib
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+__all__ = [
+    "BlobPathDecoder", "MemoryViewIO", "compress_stream", "decompress_stream", "gzip_decompress", "is_gzip_compressed",
+    "json_dumps", "json_loads", "load_json_bytes", "load_parquet_bytes", "load_pickle_stream", "ls_filter",
+    "pickle_dumps_out_of_band", "pickle_load"
+]
 
 
 class BlobPathDecoder:
@@ -61,6 +88,8 @@ class BlobPathDecoder:
             raise AzfsInputError("`%` should be 0")
 
         cls._decode_path_pattern_list.append(pattern)
+        # decoded results may change with the new pattern
+        cls._decode.cache_clear()
         return pattern
 
     @staticmethod
@@ -102,6 +131,7 @@ class BlobPathDecoder:
         return storage_account_name, account_type, container_name, blob_name
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def _decode(cls, path) -> Tuple[str, str, str, str]:
         """
         decode input [path] such as
@@ -109,6 +139,7 @@ class BlobPathDecoder:
         * ([a-z0-9]*)/(.+?)/(.*)
 
         dfs: data_lake, blob: blob
+        the result is cached by the path, because the same path is decoded many times.
         Args:
             path:
 
@@ -125,6 +156,28 @@ class BlobPathDecoder:
                 continue
         raise AzfsInvalidPathError(f"Your input path {path} is not matched.")
 
+    @classmethod
+    def decode_with_url(cls, path: str) -> Tuple[str, str, str, str]:
+        """
+        same as ``BlobPathDecoder(path).get_with_url()``, but the path is decoded by the cached ``_decode()``
+        without creating an instance.
+
+        Args:
+            path:
+
+        Returns:
+            tuple of str: account_url, account_type, container_name, blob_name
+
+        Raises:
+            AzfsInvalidPathError: when pattern not matched
+        """
+        storage_account_name, account_type, container_name, blob_name = cls._decode(path=path)
+        return \
+            f"https://{storage_account_name}.{account_type}.core.windows.net", \
+            account_type, \
+            container_name, \
+            blob_name
+
     def decode(self, path: str):
         self.storage_account_name, self.account_type, self.container_name, self.blob_name = self._decode(path=path)
         return self
@@ -143,6 +196,374 @@ class BlobPathDecoder:
             self.container_name, \
             self.blob_name
 
+# ============= #
+# gzip checking #
+# ============= #
+
+
+def is_gzip_compressed(path: str, data) -> bool:
+    """
+    check if the downloaded data is still gzip-compressed.
+    The blob with ``Content-Encoding: gzip`` is already decompressed by the http transport,
+    so check the magic number in addition to the extension.
+
+    Args:
+        path: file-path, ends with ``.gz`` or ``.gzip``
+        data: downloaded data
+
+    Returns:
+        True if the data should be decompressed
+    """
+    if not path.lower().endswith((".gz", ".gzip")):
+        return False
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data[:2]) == b"\x1f\x8b"
+    return True
+
+
+# =========== #
+# compression #
+# =========== #
+
+
+def _gzip_file(file_obj, mode: str):
+    """
+    GzipFile with ``isal`` if installed, which (de)compresses gzip several times faster than the standard zlib.
+    the format is the same, so the file can be read by either of them.
+    """
+    if igzip is not None:
+        return igzip.IGzipFile(fileobj=file_obj, mode=mode)
+    return gzip.GzipFile(fileobj=file_obj, mode=mode)
+
+
+def gzip_decompress(data) -> bytes:
+    """
+    decompress whole gzip data with ``isal`` if installed, otherwise with the standard ``gzip`` module.
+
+    Args:
+        data: bytes-like object of gzip compressed data
+
+    Returns:
+        decompressed bytes
+    """
+    if igzip is not None:
+        return igzip.decompress(data)
+    return gzip.decompress(data)
+
+
+def compress_stream(file_obj, compression: str):
+    """
+    wrap the writable file-like object to write compressed data, without holding whole uncompressed data.
+    ``zstd`` and ``lz4`` require ``zstandard`` and ``lz4`` packages respectively,
+    and ``gzip`` is faster with ``isal`` package.
+    closing the returned object flushes the compressed data, but does not close the file_obj.
+
+    Args:
+        file_obj: writable file-like object
+        compression: gzip, bz2, xz, zstd or lz4.
+
+    Returns:
+        writable file-like object
+
+    Raises:
+        AzfsInputError: when the compression is not supported
+
+    Examples:
+        >>> import io
+        >>> import azfs
+        >>> buffer = io.BytesIO()
+        >>> with azfs.utils.compress_stream(buffer, compression="gzip") as f:
+        ...     f.write(b"some data")
+    """
+    if compression == "gzip":
+        return _gzip_file(file_obj, mode="wb")
+    elif compression == "bz2":
+        return bz2.BZ2File(file_obj, mode="wb")
+    elif compression == "xz":
+        return lzma.LZMAFile(file_obj, mode="wb")
+    elif compression == "zstd":
+        import zstandard
+        # compress with all cpu cores
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(file_obj, closefd=False)
+    elif compression == "lz4":
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(file_obj, mode="wb", compression_level=0)
+    raise AzfsInputError(f"compression `{compression}` is not supported")
+
+
+def decompress_stream(file_obj, compression: Optional[str]):
+    """
+    wrap the file-like object to read decompressed data, without decompressing whole data at once.
+
+    Args:
+        file_obj: file-like object of compressed data
+        compression: gzip, bz2, xz, zstd or lz4. otherwise, the file_obj is returned as it is.
+
+    Returns:
+        file-like object
+    """
+    if compression == "gzip":
+        return _gzip_file(file_obj, mode="rb")
+    elif compression == "bz2":
+        return bz2.BZ2File(file_obj)
+    elif compression == "xz":
+        return lzma.LZMAFile(file_obj)
+    elif compression == "zstd":
+        import zstandard
+        # the stream reader has no `readline()`, which `pickle.load()` requires
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(file_obj))
+    elif compression == "lz4":
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(file_obj)
+    return file_obj
+
+
+# ================= #
+# memoryview reader #
+# ================= #
+
+
+class MemoryViewIO(io.RawIOBase):
+    """
+    file-like object to read ``memoryview``, without copying whole data like ``io.BytesIO(view)``.
+    The Azure SDK cannot upload ``memoryview`` as it is, but can upload seekable file-like object in blocks.
+    Several views are read in order as one file, without joining them.
+    """
+    def __init__(self, *views: Union[bytes, memoryview]):
+        self._views = [memoryview(view).cast("B") for view in views]
+        # start position of each view
+        self._starts = list(itertools.accumulate([0] + [len(view) for view in self._views[:-1]]))
+        self._size = sum(len(view) for view in self._views)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        size = max(0, min(len(b), self._size - self._position))
+        written = 0
+        index = bisect.bisect_right(self._starts, self._position) - 1
+        while written < size:
+            view = self._views[index]
+            start = self._position + written - self._starts[index]
+            part = min(size - written, len(view) - start)
+            b[written:written + part] = view[start:start + part]
+            written += part
+            index += 1
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._size + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+# ======================== #
+# out-of-band pickle frame #
+# ======================== #
+
+# header of the framed pickle, which is not a valid pickle stream
+_PICKLE_FRAME_MAGIC = b"AZFSPKL\x05"
+_PICKLE_FRAME_LENGTH = struct.Struct("<Q")
+
+
+def pickle_dumps_out_of_band(obj) -> List[Union[bytes, memoryview]]:
+    """
+    pickle the obj with protocol 5, and return the pickle and its out-of-band buffers in a length-prefixed frame.
+    numpy arrays in pd.DataFrame are not copied, and the frame refers their memory directly.
+
+    Args:
+        obj: object to pickle
+
+    Returns:
+        list of bytes and memoryview, to be uploaded in order
+
+    Examples:
+        >>> import azfs
+        >>> frame = azfs.utils.pickle_dumps_out_of_band(df)
+        >>> df = azfs.utils.pickle_load(azfs.utils.MemoryViewIO(*frame))
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        raise AzfsInputError("out-of-band pickle requires pickle protocol 5 (Python 3.8+)")
+    buffers = []
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    frame = [
+        _PICKLE_FRAME_MAGIC,
+        _PICKLE_FRAME_LENGTH.pack(len(header)),
+        header,
+        _PICKLE_FRAME_LENGTH.pack(len(buffers))
+    ]
+    for buffer in buffers:
+        view = buffer.raw()
+        frame.extend([_PICKLE_FRAME_LENGTH.pack(view.nbytes), view])
+    return frame
+
+
+def _read_exactly(file_obj, size: int) -> bytearray:
+    data = bytearray(size)
+    view = memoryview(data)
+    position = 0
+    while position < size:
+        read_size = file_obj.readinto(view[position:])
+        if not read_size:
+            raise EOFError("the out-of-band pickle frame is truncated")
+        position += read_size
+    return data
+
+
+def pickle_load(file_obj):
+    """
+    unpickle the file-like object, written by either ``pickle.dump()`` or ``pickle_dumps_out_of_band()``.
+
+    Args:
+        file_obj: file-like object
+
+    Returns:
+        unpickled object
+    """
+    if not hasattr(file_obj, "peek"):
+        file_obj = io.BufferedReader(file_obj)
+    if file_obj.peek(len(_PICKLE_FRAME_MAGIC))[:len(_PICKLE_FRAME_MAGIC)] != _PICKLE_FRAME_MAGIC:
+        return pickle.load(file_obj)
+
+    file_obj.read(len(_PICKLE_FRAME_MAGIC))
+    (header_length,) = _PICKLE_FRAME_LENGTH.unpack(_read_exactly(file_obj, _PICKLE_FRAME_LENGTH.size))
+    header = _read_exactly(file_obj, header_length)
+    (buffer_count,) = _PICKLE_FRAME_LENGTH.unpack(_read_exactly(file_obj, _PICKLE_FRAME_LENGTH.size))
+    buffers = []
+    for _ in range(buffer_count):
+        (buffer_length,) = _PICKLE_FRAME_LENGTH.unpack(_read_exactly(file_obj, _PICKLE_FRAME_LENGTH.size))
+        # writable buffers, so that numpy arrays refer them without copy
+        buffers.append(_read_exactly(file_obj, buffer_length))
+    return pickle.loads(header, buffers=buffers)
+
+
+# ============ #
+# json parsing #
+# ============ #
+
+
+def json_loads(data, use_orjson: bool = False, **kwargs):
+    """
+    parse json with the standard ``json`` module.
+    with ``use_orjson=True``, ``orjson`` is used if installed and no other keyword is given.
+    ``orjson`` is faster, but parses integers wider than 64 bits as float.
+
+    Args:
+        data: bytes, bytearray, memoryview or str
+        use_orjson: if True, parse with ``orjson`` when available.
+            ``json`` is used instead for documents ``orjson`` rejects, such as ones including NaN or Infinity.
+        **kwargs: keywords to put json.loads(), such as ``parse_float``.
+
+    Returns:
+        parsed object
+    """
+    if use_orjson and orjson is not None and not kwargs:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data, **kwargs)
+
+
+def json_dumps(data, use_orjson: bool = False, **kwargs) -> bytes:
+    """
+    serialize to json bytes with the standard ``json`` module, as same as ``json.dumps(data).encode("utf-8")``.
+    with ``use_orjson=True``, ``orjson`` is used if installed and no other keyword is given.
+    ``orjson`` is faster, but writes compact output, non-ASCII characters without escapes, and NaN or Infinity as null.
+
+    Args:
+        data: object to serialize
+        use_orjson: if True, serialize with ``orjson`` when available.
+            ``json`` is used instead for data ``orjson`` cannot serialize, such as integers wider than 64 bits.
+        **kwargs: keywords to put json.dumps(), such as ``indent``.
+
+    Returns:
+        UTF-8 encoded bytes
+    """
+    if use_orjson and orjson is not None and not kwargs:
+        try:
+            # keys other than str are converted to str, as same as json.dumps()
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError is a subclass of TypeError
+            pass
+    return json.dumps(data, **kwargs).encode("utf-8")
+
+
+# ======================= #
+# reading downloaded data #
+# ======================= #
+
+
+def load_pickle_stream(file_obj, compression: Optional[str]) -> pd.DataFrame:
+    """
+    unpickle pd.DataFrame from the downloaded file-like object.
+
+    Args:
+        file_obj: file-like object of the downloaded data
+        compression: gzip, bz2, xz, zstd or lz4. otherwise, the file_obj is read as it is.
+
+    Returns:
+        pd.DataFrame
+    """
+    # decompress while unpickling, without holding whole decompressed bytes
+    data = pickle_load(decompress_stream(file_obj, compression=compression))
+    # pickled pd.DataFrame is returned as it is, to avoid copying
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+def load_parquet_bytes(path: str, data) -> pd.DataFrame:
+    """
+    read parquet as pd.DataFrame from the downloaded bytes-like object, with ``pyarrow``.
+
+    Args:
+        path: file-path, to check if the data is gzip-compressed
+        data: bytes-like object of the downloaded data
+
+    Returns:
+        pd.DataFrame
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    if is_gzip_compressed(path=path, data=data):
+        data = gzip_decompress(data)
+    # read on the bytes without copy, so that pyarrow does not read via python-level `read()`
+    table = pq.read_table(pa.BufferReader(data), use_threads=True)
+    # release arrow memory while converting to pd.DataFrame
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_json_bytes(path: str, data, **kwargs):
+    """
+    parse json from the downloaded bytes-like object.
+
+    Args:
+        path: file-path, to check if the data is gzip-compressed
+        data: bytes-like object of the downloaded data
+        **kwargs: keywords to put json_loads()
+
+    Returns:
+        parsed object
+    """
+    if is_gzip_compressed(path=path, data=data):
+        data = gzip_decompress(data)
+    return json_loads(data, **kwargs)
+
+
 # ================ #
 # filter based `/` #
 # ================ #
@@ -52,6 +52,10 @@ setuptools.setup(
         "fsspec",
         "click"
     ],
+    extras_require={
+        # AsyncAzFileClient and DataFrameReader.load_async()
+        "async": ["aiohttp"]
+    },
     license="MIT",
     entry_points={
         'console_scripts': [
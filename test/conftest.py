@@ -1,4 +1,5 @@
 import bz2
+import copy
 import gzip
 import io
 import json
@@ -8,6 +9,7 @@ import pickle
 import sys
 import pandas as pd
 import pytest
+from azure.identity import DefaultAzureCredential
 import azfs
 
 # テスト対象のファイルへのパスを通している
@@ -17,110 +19,88 @@ SOURCE_PATH = PARENT_PATH.rsplit('/', 1)[0]
 
 sys.path.append(f"{SOURCE_PATH}")
 
+# payloads are serialized and compressed once, and shared by the tests.
+_DATA = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
+_DF = pd.DataFrame.from_dict(_DATA, orient="index")
+_CSV_BYTES = b'name,age\nalice,10\nbob,10\n'
+_CSV_GZ_BYTES = gzip.compress(_CSV_BYTES)
+_JSON_BYTES = json.dumps(_DATA).encode("utf-8")
+_TABLE_BYTES = b'\tname\tage\n1\talice\t10\n2\tbob\t10\n'
+_PICKLE_BYTES = pickle.dumps(_DF)
+_PICKLE_PAYLOADS = {
+    None: _PICKLE_BYTES,
+    "gzip": gzip.compress(_PICKLE_BYTES),
+    "bz2": bz2.compress(_PICKLE_BYTES),
+    # the default preset 6 is unnecessarily slow for tests
+    "xz": lzma.compress(_PICKLE_BYTES, preset=1),
+}
+# listings are immutable, so that the same tuple can be returned to every test
+_LS_FILES = ("test1.csv", "test2.csv", "dir/")
+_LS_FILES_FOR_GLOB = (
+    "root_folder/test1.csv",
+    "root_folder/test2.csv",
+    "root_folder/test1.json",
+    "root_folder/dir1/test1.csv",
+    "root_folder/dir1/test2.csv",
+    "root_folder/dir1/test1.json",
+    "root_folder/dir2/test1.csv",
+    "root_folder/dir2/test2.csv",
+    "root_folder/dir2/test1.json",
+)
+
 
 @pytest.fixture()
 def _get_csv(mocker):
-    """
-    original data is
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    :param mocker:
-    :return:
-    """
-    return_value = b'name,age\nalice,10\nbob,10\n'
     func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
+    func_mock.return_value = _CSV_BYTES
     yield func_mock
 
 
 @pytest.fixture()
 def _get_csv_gz(mocker):
-    """
-    original data is
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-
-    Args:
-        mocker:
-
-    Returns:
-
-    """
-    data = b'name,age\nalice,10\nbob,10\n'
-    return_value = gzip.compress(data)
     func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
+    func_mock.return_value = _CSV_GZ_BYTES
     yield func_mock
 
 
 @pytest.fixture()
 def _get_table(mocker):
-    """
-    original data is
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    :param mocker:
-    :return:
-    """
-    return_value = b'\tname\tage\n1\talice\t10\n2\tbob\t10\n'
     func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
+    func_mock.return_value = _TABLE_BYTES
     yield func_mock
 
 
+def _get_pickle_mock(mocker, compression):
+    func_mock = mocker.MagicMock()
+    # new file-like object for each test, because it is consumed by reading
+    func_mock.return_value = io.BytesIO(_PICKLE_PAYLOADS[compression])
+    return func_mock
+
+
 @pytest.fixture()
 def _get_pickle(mocker):
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    p = pickle.dumps(df)
-    return_value = io.BytesIO(p)
-    func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
-    yield func_mock
+    yield _get_pickle_mock(mocker, compression=None)
 
 
 @pytest.fixture()
 def _get_pickle_gzip(mocker):
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    p = pickle.dumps(df)
-    return_value = io.BytesIO(gzip.compress(p))
-    func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
-    yield func_mock
+    yield _get_pickle_mock(mocker, compression="gzip")
 
 
 @pytest.fixture()
 def _get_pickle_bz2(mocker):
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    p = pickle.dumps(df)
-    return_value = io.BytesIO(bz2.compress(p))
-    func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
-    yield func_mock
+    yield _get_pickle_mock(mocker, compression="bz2")
 
 
 @pytest.fixture()
 def _get_pickle_xz(mocker):
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    p = pickle.dumps(df)
-    return_value = io.BytesIO(lzma.compress(p))
-    func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
-    yield func_mock
+    yield _get_pickle_mock(mocker, compression="xz")
 
 
 @pytest.fixture()
 def _get_json(mocker):
-    """
-    :param mocker:
-    :return:
-    """
-    return_value = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
     func_mock = mocker.MagicMock()
-    func_mock.return_value = json.dumps(return_value)
+    func_mock.return_value = _JSON_BYTES
     yield func_mock
 
 
@@ -138,64 +118,50 @@ def _put(mocker):
 
 @pytest.fixture()
 def _ls(mocker):
-    """
-    :param mocker:
-    :return:
-    """
-    return_value = ["test1.csv", "test2.csv", "dir/"]
     func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
+    func_mock.return_value = _LS_FILES
     yield func_mock
 
 
 @pytest.fixture()
 def _ls_for_glob(mocker):
-    """
-    :param mocker:
-    :return:
-    """
-    return_value = [
-        "root_folder/test1.csv",
-        "root_folder/test2.csv",
-        "root_folder/test1.json",
-        "root_folder/dir1/test1.csv",
-        "root_folder/dir1/test2.csv",
-        "root_folder/dir1/test1.json",
-        "root_folder/dir2/test1.csv",
-        "root_folder/dir2/test2.csv",
-        "root_folder/dir2/test1.json",
-    ]
     func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
+    func_mock.return_value = _LS_FILES_FOR_GLOB
     yield func_mock
 
 
 @pytest.fixture()
-def _rm(mocker):
+def _rm():
     """
-    :param mocker:
-    :return:
+    plain function, because no test inspects the calls of ``_rm``.
+    ``_put``, ``_ls`` and ``_get_*`` stay MagicMock, for ``call_args``, ``call_count`` and ``side_effect``.
     """
-    return_value = True
-    func_mock = mocker.MagicMock()
-    func_mock.return_value = return_value
-    yield func_mock
+    def _rm_stub(self, path: str):
+        return True
+    yield _rm_stub
 
 
 @pytest.fixture()
-def var_json() -> pd.DataFrame:
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    yield data
+def var_json() -> dict:
+    yield copy.deepcopy(_DATA)
 
 
 @pytest.fixture()
 def var_df() -> pd.DataFrame:
-    data = {"1": {"name": "alice", "age": "10"}, "2": {"name": "bob", "age": "10"}}
-    df = pd.DataFrame.from_dict(data, orient="index")
-    yield df
+    # copy of the prebuilt DataFrame, in case a test modifies it
+    yield _DF.copy()
+
+
+@pytest.fixture(scope="session")
+def _credential():
+    """
+    DefaultAzureCredential is created once, and shared by the clients of each test
+    """
+    yield DefaultAzureCredential()
 
 
 @pytest.fixture()
-def var_azc() -> azfs.AzFileClient:
-    azc = azfs.AzFileClient()
+def var_azc(_credential) -> azfs.AzFileClient:
+    # new client for each test, so that the caches and the attached pandas functions are not shared
+    azc = azfs.AzFileClient(credential=_credential)
     yield azc
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from azfs.clients.blob_client import AzBlobClient
 from azure.storage.blob import BlobClient, ContainerClient
@@ -12,6 +13,12 @@ test_file_path = "https://test.blob.core.windows.net/test/test.csv"
 test_file_ls_path = "https://test.blob.core.windows.net/test/"
 
 
+@pytest.fixture(autouse=True)
+def _invalidate_cache():
+    # `azc` is shared among the tests, so drop the cached file properties
+    azc.invalidate(path=test_file_path)
+
+
 class BlobMock:
     # dummy blob file class
     def __init__(self, name):
@@ -92,6 +99,14 @@ def test_blob_upload(mocker, blob_client):
     result = blob_client.put(path=test_file_path, data={})
     assert result
 
+    # memoryview is uploaded as file-like object
+    data = b"name,age\nalice,10\n"
+    result = blob_client.put(path=test_file_path, data=memoryview(data))
+    assert result
+    _, kwargs = func_mock.call_args
+    assert kwargs["data"].read() == data
+    assert "length" not in kwargs
+
 
 @pytest.mark.parametrize("blob_client", [
     # blob client
@@ -124,10 +139,67 @@ def test_blob_ls(mocker, blob_client):
 
     # mock
     func_mock = mocker.MagicMock()
-    func_mock.return_value = [
-        BlobMock("test.csv"),
+    func_mock.return_value.by_page.return_value = [
+        [BlobMock("test1.csv"), BlobMock("test2.csv")],
+        [BlobMock("test3.csv")],
     ]
 
     mocker.patch.object(ContainerClient, "list_blobs", func_mock)
     file_list = blob_client.ls(path=test_file_ls_path, file_path=test_file_ls_path)
-    assert file_list
+    assert file_list == ["test1.csv", "test2.csv", "test3.csv"]
+    _, kwargs = func_mock.call_args
+    assert kwargs["results_per_page"] == AzBlobClient.LS_RESULTS_PER_PAGE
+
+
+@pytest.mark.parametrize("blob_client", [
+    # blob client
+    blob_client_credential,
+    blob_client_connection_string,
+])
+def test_blob_download(mocker, blob_client):
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+
+    # mock
+    downloader_mock = mocker.MagicMock()
+    downloader_mock.readall.return_value = b"name,age\nalice,10\n"
+    func_mock = mocker.MagicMock()
+    func_mock.return_value = downloader_mock
+
+    mocker.patch.object(BlobClient, "download_blob", func_mock)
+    data = blob_client.get(path=test_file_path)
+    assert data == b"name,age\nalice,10\n"
+    _, kwargs = func_mock.call_args
+    assert kwargs["max_concurrency"] == AzBlobClient.MAX_CONCURRENCY
+
+    _ = blob_client.get(path=test_file_path, max_concurrency=2)
+    _, kwargs = func_mock.call_args
+    assert kwargs["max_concurrency"] == 2
+
+
+def test_blob_client_reuse():
+    # ===================== #
+    # test for AzBlobClient #
+    # ===================== #
+    blob_client = AzBlobClient(credential=credential)
+    service_client = blob_client.get_service_client_from_url(account_url=test_file_ls_path)
+    assert service_client is blob_client.get_service_client_from_url(account_url=test_file_ls_path)
+
+    # service clients are created again after closed
+    blob_client.close()
+    assert service_client is not blob_client.get_service_client_from_url(account_url=test_file_ls_path)
+
+    # ===================== #
+    # test for AzfsClient   #
+    # ===================== #
+    azfs_client = azfs.clients.AzfsClient(credential=credential, connection_string=None)
+    assert azfs_client.get_client("blob") is azfs_client.get_client("blob")
+
+
+def test_blob_client_reuse_in_threads():
+    blob_client = AzBlobClient(credential=credential)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        service_client_list = list(executor.map(
+            lambda _: blob_client.get_service_client_from_url(account_url=test_file_ls_path), range(32)))
+    assert all(service_client is service_client_list[0] for service_client in service_client_list)
@@ -1,9 +1,24 @@
+import sys
 from azfs.cli.constants import WELCOME_PROMPT
 from click.testing import CliRunner
 from azfs.cli import cmd
+from azfs.cli.factory import CliFactory
 
 
 def test_cmd():
     result = CliRunner().invoke(cmd)
     # result.stdout
     assert result.stdout == f"{WELCOME_PROMPT}\n"
+
+
+def test_load_export_decorator(tmp_path):
+    (tmp_path / "__init__.py").write_text(
+        "from azfs.az_file_client import ExportDecorator\n"
+        "export_decorator = ExportDecorator()\n"
+    )
+    cli_factory = CliFactory(str(tmp_path))
+    export_decorator = cli_factory.load_export_decorator("__init__")
+    assert export_decorator.functions == []
+    # the module is loaded only once
+    assert cli_factory.load_export_decorator("__init__") is export_decorator
+    assert str(tmp_path) not in sys.path
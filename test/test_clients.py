@@ -1,5 +1,10 @@
+import asyncio
+import io
+import json
+import pickle
 import pytest
 
+
 # in order to avoid warning .coverage
 # see https://pytest-cov.readthedocs.io/en/latest/subprocess-support.html#if-you-use-multiprocessing-process
 try:
@@ -11,6 +16,7 @@ else:
 
 import azfs
 from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import ContainerClient
 from azfs.clients.blob_client import AzBlobClient
 from azfs.clients.datalake_client import AzDataLakeClient
 from azfs.clients.client_interface import ClientInterface
@@ -23,43 +29,57 @@ from azfs.error import (
 import pandas as pd
 
 
-class TestClientIntexrface:
-    def test_not_implemented_error(self, var_azc):
-        client_interface = ClientInterface(credential="")
-        # the file below is not exists
-        account_url = "https://testazfs.blob.core.windows.net/"
-        path = f"{account_url}test_caontainer/test.csv"
-        file_path = "test_caontainer"
+# the container below is not exists
+BLOB_BASE = "https://testazfs.blob.core.windows.net/test_caontainer/"
+DFS_BASE = "https://testazfs.dfs.core.windows.net/test_caontainer/"
 
-        with pytest.raises(NotImplementedError):
-            client_interface.get(path=path)
 
-        with pytest.raises(NotImplementedError):
-            client_interface.put(path=path, data={})
+@pytest.fixture(params=[(BLOB_BASE, AzBlobClient), (DFS_BASE, AzDataLakeClient)], ids=["blob", "dfs"])
+def client_kind(request):
+    """
+    url of the container, and the client class to patch
+    """
+    return request.param
 
-        with pytest.raises(NotImplementedError):
-            client_interface.ls(path=path, file_path=file_path)
 
-        with pytest.raises(NotImplementedError):
-            client_interface.rm(path=path)
+def _run_until_complete(coro):
+    """
+    ``asyncio.run()`` is not available in python3.6
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
 
-        with pytest.raises(NotImplementedError):
-            client_interface.info(path=path)
-
-        with pytest.raises(NotImplementedError):
-            client_interface.get_container_client_from_path(path=path)
-
-        with pytest.raises(NotImplementedError):
-            client_interface.get_file_client_from_path(path=path)
 
+class TestClientIntexrface:
+    # the file below is not exists
+    account_url = "https://testazfs.blob.core.windows.net/"
+    path = f"{account_url}test_caontainer/test.csv"
+
+    @pytest.mark.parametrize("method, kwargs", [
+        ("get", {"path": path}),
+        ("put", {"path": path, "data": {}}),
+        ("ls", {"path": path, "file_path": "test_caontainer"}),
+        ("rm", {"path": path}),
+        ("info", {"path": path}),
+        ("get_container_client_from_path", {"path": path}),
+        ("get_file_client_from_path", {"path": path}),
+        ("get_service_client_from_url", {"account_url": account_url}),
+    ])
+    def test_not_implemented_error(self, method, kwargs):
+        client_interface = ClientInterface(credential="")
         with pytest.raises(NotImplementedError):
-            client_interface.get_service_client_from_url(account_url=account_url)
+            getattr(client_interface, method)(**kwargs)
 
+    def test_not_implemented_error_connection_string(self):
         # connection_stringから作成する場合
         client_interface = ClientInterface(credential=None, connection_string="")
         with pytest.raises(NotImplementedError):
-            client_interface.get_service_client_from_url(account_url=account_url)
+            client_interface.get_service_client_from_url(account_url=self.account_url)
 
+    def test_not_implemented_error_queue_glob(self, var_azc):
         with pytest.raises(NotImplementedError):
             # use with multiprocessing
             var_azc.glob("https://testazfs.queue.core.windows.net/test_queue/test/*.msg")
@@ -72,22 +92,56 @@ class TestClientIntexrface:
             var_azc.read().csv(path=None)
 
 
-class TestReadCsv:
+def _check_df(data):
+    assert "name" in data.columns
+    assert "age" in data.columns
+    assert len(data.index) == 2
 
-    def test_blob_read_csv(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv)
 
-        # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+def _check_json(data, expected):
+    assert data == expected
+
+
+# function of AzFileClient, `_get` fixture, file name
+READ_CASES = [
+    ("read_csv", "_get_csv", "test.csv"),
+    ("read_csv", "_get_csv_gz", "test.csv.gz"),
+    ("read_table", "_get_table", "test.tsv"),
+    ("read_json", "_get_json", "test.json"),
+]
+
+
+class TestRead:
+
+    @pytest.mark.parametrize("reader, get_fixture, file_name", READ_CASES)
+    def test_read(self, client_kind, request, mocker, var_azc, var_json, reader, get_fixture, file_name):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_get", request.getfixturevalue(get_fixture))
 
         # read data from not-exist path
+        path = f"{container_url}{file_name}"
+        results = [getattr(var_azc, reader)(path)]
+        # pandas-like function, if registered
         with var_azc:
-            df = pd.read_csv_az(path)
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
+            if getattr(pd, f"{reader}_az", None) is not None:
+                results.append(getattr(pd, f"{reader}_az")(path))
+        for data in results:
+            if isinstance(data, pd.DataFrame):
+                _check_df(data)
+            else:
+                _check_json(data, expected=var_json)
+
+
+class TestReadCsv:
 
+    def test_read_csv(self, client_kind, mocker, _get_csv, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_get", _get_csv)
+
+        # the file below is not exists
+        path = f"{container_url}test.csv"
+
+        # read data from not-exist path, `read_csv()` and `pd.read_csv_az()` are tested in `TestRead`
         df = var_azc.read().csv(path=path)
         columns = df.columns
         assert "name" in columns
@@ -118,7 +172,7 @@ class TestReadCsv:
         mocker.patch.object(AzBlobClient, "_ls", _ls_for_glob)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
+        path = f"{BLOB_BASE}root_folder/*.csv"
         df = var_azc.read().csv(path=path)
         columns = df.columns
         assert "name" in columns
@@ -131,13 +185,19 @@ class TestReadCsv:
         assert "age" in columns
         assert len(df.index) == 4
 
+        # files are listed only once for the same pattern
+        call_count = _ls_for_glob.call_count
+        df = var_azc.read(path=path).csv(path=path)
+        assert len(df.index) == 4
+        assert _ls_for_glob.call_count == call_count + 1
+
     def test_blob_read_list_csv(self, mocker, _get_csv, var_azc):
         mocker.patch.object(AzBlobClient, "_get", _get_csv)
 
         # the file below is not exists
         path_list = [
-            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test1.csv",
-            "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test2.csv"
+            f"{BLOB_BASE}root_folder/test1.csv",
+            f"{BLOB_BASE}root_folder/test2.csv"
         ]
         df = var_azc.read().csv(path=path_list)
         columns = df.columns
@@ -151,19 +211,23 @@ class TestReadCsv:
         assert "age" in columns
         assert len(df.index) == 4
 
-    def test_blob_read_csv_gz(self, mocker, _get_csv_gz, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv_gz)
-
-        # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv.gz"
+        # tuple is also acceptable
+        df = var_azc.read(path=tuple(path_list)).csv()
+        assert len(df.index) == 4
+        assert list(df.index) == [0, 1, 2, 3]
 
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_csv_az(path)
+        # with specified number of threads
+        df = var_azc.read(path=path_list, max_workers=1).csv()
         columns = df.columns
         assert "name" in columns
         assert "age" in columns
-        assert len(df.index) == 2
+        assert len(df.index) == 4
+
+    def test_blob_read_csv_gz(self, mocker, _get_csv_gz, var_azc):
+        mocker.patch.object(AzBlobClient, "_get", _get_csv_gz)
+
+        # the file below is not exists
+        path = f"{BLOB_BASE}test.csv.gz"
 
         df = var_azc.read().csv(path=path)
         columns = df.columns
@@ -171,189 +235,177 @@ class TestReadCsv:
         assert "age" in columns
         assert len(df.index) == 2
 
-    def test_dfs_read_csv(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
+    def test_blob_read_csv_gz_decoded(self, mocker, _get_csv, var_azc):
+        # `Content-Encoding: gzip` blob is already decompressed by the transport
+        mocker.patch.object(AzBlobClient, "_get", _get_csv)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
+        path = f"{BLOB_BASE}test.csv.gz"
 
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_csv_az(path)
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
-
-        df = var_azc.read().csv(path=path)
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
+        df = var_azc.read_csv(path)
         assert len(df.index) == 2
 
 
-class TestReadTable:
+class TestReadCsvAsync:
 
-    def test_blob_read_table(self, mocker, _get_table, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_table)
+    def test_blob_read_csv_async(self, mocker, _get_csv, var_azc):
+        async def _get(self, path, *args, **kwargs):
+            return io.BytesIO(_get_csv())
+        mocker.patch.object(azfs.AsyncAzFileClient, "_get", _get)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.tsv"
-
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_table_az(path)
+        path_list = [
+            f"{BLOB_BASE}root_folder/test1.csv",
+            f"{BLOB_BASE}root_folder/test2.csv"
+        ]
+        df = _run_until_complete(var_azc.read(path=path_list, file_format="csv").load_async())
         columns = df.columns
         assert "name" in columns
         assert "age" in columns
-        assert len(df.index) == 2
+        assert len(df.index) == 4
 
 
-class TestReadPickle:
+class TestReadJsonAsync:
 
-    def test_blob_read_pickle(self, mocker, _get_pickle, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle)
+    def test_blob_read_json_async(self, mocker, _get_json, var_json):
+        async def _download(self, path, *args, **kwargs):
+            return _get_json()
+        mocker.patch.object(azfs.AsyncAzFileClient, "_download", _download)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.json"
 
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_pickle_az(path, compression=None)
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
+        async def main():
+            async with azfs.AsyncAzFileClient(credential="") as aazc:
+                return await aazc.read_json(path)
+        _check_json(_run_until_complete(main()), expected=var_json)
 
-    def test_blob_read_pickle_pyspark_like(self, mocker, _get_pickle, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle)
 
-        # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
-
-        # read data from not-exist path
-        df = var_azc.read().pickle(path=path, compression=None)
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
+class TestReadPickle:
 
-    def test_blob_read_pickle_gzip(self, mocker, _get_pickle_gzip, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_gzip)
+    @pytest.mark.parametrize("compression, get_pickle", [
+        (None, "_get_pickle"),
+        ("gzip", "_get_pickle_gzip"),
+        ("bz2", "_get_pickle_bz2"),
+        ("xz", "_get_pickle_xz"),
+    ])
+    def test_blob_read_pickle(self, request, mocker, var_azc, compression, get_pickle):
+        mocker.patch.object(AzBlobClient, "_get", request.getfixturevalue(get_pickle))
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.pkl"
 
         # read data from not-exist path
         with var_azc:
-            df = pd.read_pickle_az(path, compression="gzip")
+            df = pd.read_pickle_az(path, compression=compression)
         columns = df.columns
         assert "name" in columns
         assert "age" in columns
         assert len(df.index) == 2
 
-    def test_blob_read_pickle_gzip_pyspark_like(self, mocker, _get_pickle_gzip, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_gzip)
+    @pytest.mark.parametrize("compression, get_pickle", [
+        (None, "_get_pickle"),
+        ("gzip", "_get_pickle_gzip"),
+        ("bz2", "_get_pickle_bz2"),
+        ("xz", "_get_pickle_xz"),
+    ])
+    def test_blob_read_pickle_pyspark_like(self, request, mocker, var_azc, compression, get_pickle):
+        mocker.patch.object(AzBlobClient, "_get", request.getfixturevalue(get_pickle))
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.pkl"
 
         # read data from not-exist path
-        df = var_azc.read().pickle(path=path, compression="gzip")
+        df = var_azc.read().pickle(path=path, compression=compression)
         columns = df.columns
         assert "name" in columns
         assert "age" in columns
         assert len(df.index) == 2
 
-    def test_blob_read_pickle_bz2(self, mocker, _get_pickle_bz2, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_bz2)
+    @pytest.mark.parametrize("compression, module_name", [
+        ("zstd", "zstandard"),
+        ("lz4", "lz4"),
+    ])
+    def test_blob_read_write_pickle_optional_compression(self, mocker, _put, var_azc, var_df, compression, module_name):
+        pytest.importorskip(module_name)
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.pkl"
 
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_pickle_az(path, compression="bz2")
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
-
-    def test_blob_read_pickle_bz2_pyspark_like(self, mocker, _get_pickle_bz2, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_bz2)
+        assert var_azc.write_pickle(path=path, df=var_df, compression=compression)
+        _, kwargs = _put.call_args
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = kwargs["data"]
+        mocker.patch.object(AzBlobClient, "_get", func_mock)
+        df = var_azc.read_pickle(path=path, compression=compression)
+        assert df.equals(var_df)
+
+    @pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="pickle protocol 5 requires python>=3.8")
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_blob_read_write_pickle_out_of_band(self, mocker, _put, var_azc, var_df, compression):
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
-
-        # read data from not-exist path
-        df = var_azc.read().pickle(path=path, compression="bz2")
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
+        path = f"{BLOB_BASE}test.pkl"
 
-    def test_blob_read_pickle_xz(self, mocker, _get_pickle_xz, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_xz)
+        assert var_azc.write_pickle(path=path, df=var_df, compression=compression, out_of_band=True)
+        _, kwargs = _put.call_args
+        data = kwargs["data"]
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = io.BytesIO(data) if isinstance(data, bytes) else data
+        mocker.patch.object(AzBlobClient, "_get", func_mock)
+        df = var_azc.read_pickle(path=path, compression=compression)
+        assert df.equals(var_df)
 
-        # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
 
-        # read data from not-exist path
-        with var_azc:
-            df = pd.read_pickle_az(path, compression="xz")
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
-        assert len(df.index) == 2
+class TestReadParquet:
 
-    def test_blob_read_pickle_xz_pyspark_like(self, mocker, _get_pickle_xz, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_pickle_xz)
+    def test_blob_read_parquet(self, mocker, var_azc, var_df):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(var_df), sink)
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = sink.getvalue().to_pybytes()
+        mocker.patch.object(AzBlobClient, "_get", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.parquet"
 
-        # read data from not-exist path
+        df = var_azc.read_parquet(path=path)
+        pd.testing.assert_frame_equal(df, var_df)
 
-        df = var_azc.read().pickle(path=path, compression="xz")
-        columns = df.columns
-        assert "name" in columns
-        assert "age" in columns
+        df = var_azc.read().parquet(path=path)
         assert len(df.index) == 2
 
 
 class TestReadJson:
 
-    def test_blob_read_json(self, mocker, _get_json, var_azc, var_json):
-        mocker.patch.object(AzBlobClient, "_get", _get_json)
-
-        # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.json"
-
-        data = var_azc.read_json(path)
-        assert data == var_json
-
-    def test_dfs_read_json(self, mocker, _get_json, var_azc, var_json):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_json)
+    def test_blob_read_json_bytes_io(self, mocker, var_azc, var_json):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = io.BytesIO(json.dumps(var_json).encode("utf-8"))
+        mocker.patch.object(AzBlobClient, "_get", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.json"
-
+        path = f"{BLOB_BASE}test.json"
         data = var_azc.read_json(path)
-        assert data == var_json
+        _check_json(data, expected=var_json)
 
 
 class TestReadLineIter:
 
-    def test_blob_read_line_iter(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv)
+    def test_read_line_iter(self, client_kind, mocker, _get_csv, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_get", _get_csv)
 
         return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
         func_mock = mocker.MagicMock()
         func_mock.return_value = return_value
-        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(client_class, "_info", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        path = f"{container_url}test.csv"
 
         # read data from not-exist path
         line_counter = 0
@@ -362,97 +414,118 @@ class TestReadLineIter:
 
         assert line_counter == 3
 
-    def test_dfs_read_line_iter(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
 
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
+class TestReadBytesIter:
+    def test_blob_read_bytes_iter(self, mocker, var_azc):
+        data = b'name,age\nalice,10\nbob,10\n'
+
+        def _get(path, offset=None, length=None, **kwargs):
+            return data[offset:offset + length]
+        mocker.patch.object(AzBlobClient, "_get", side_effect=_get)
         func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
+        func_mock.return_value = {"size": len(data)}
+        mocker.patch.object(AzBlobClient, "_info", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
+        path = f"{BLOB_BASE}test.csv"
 
-        # read data from not-exist path
-        line_counter = 0
-        for _ in var_azc.read_line_iter(path=path):
-            line_counter += 1
-
-        assert line_counter == 3
+        chunk_list = list(var_azc.read_bytes_iter(path=path, chunk_size=10))
+        assert len(chunk_list) >= 2
+        assert all(len(chunk) >= 10 for chunk in chunk_list[:-1])
+        # line terminators are kept as they are
+        assert b"".join(chunk_list) == data
 
 
 class TestReadCsvChunk:
-    def test_blob_read_csv_chunk(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzBlobClient, "_get", _get_csv)
+    def test_read_csv_chunk(self, client_kind, mocker, _get_csv, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_get", _get_csv)
         return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
         func_mock = mocker.MagicMock()
         func_mock.return_value = return_value
-        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(client_class, "_info", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
-        chunk_size = 2
+        path = f"{container_url}test.csv"
+        chunk_size = 1
         chunk_counter = 0
         with pytest.warns(FutureWarning):
-            for _ in var_azc.read_csv_chunk(path, chunk_size):
-                chunk_counter += 1
-            assert chunk_counter == 2
-
-    def test_dfs_read_csv_chunk(self, mocker, _get_csv, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_get", _get_csv)
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
-        func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
-
-        # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
-        chunk_size = 2
-        chunk_counter = 0
-        with pytest.warns(FutureWarning):
-            for _ in var_azc.read_csv_chunk(path, chunk_size):
+            for _df in var_azc.read_csv_chunk(path, chunk_size):
                 chunk_counter += 1
+                assert len(_df.index) == chunk_size
+                assert "name" in _df.columns
             assert chunk_counter == 2
 
 
 class TestToCsv:
-    def test_blob_to_csv(self, mocker, _put, var_azc, var_df):
-        mocker.patch.object(AzBlobClient, "_put", _put)
+    def test_to_csv(self, client_kind, mocker, _put, var_azc, var_df):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.csv"
+        path = f"{container_url}test.csv"
 
         with var_azc:
             result = var_df.to_csv_az(path)
         assert result
 
-    def test_dfs_to_csv(self, mocker, _put, var_azc, var_df):
-        mocker.patch.object(AzDataLakeClient, "_put", _put)
+    def test_blob_to_csv_buffer(self, mocker, _put, var_azc, var_df):
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.csv"
+        path = f"{BLOB_BASE}test.csv"
 
-        with var_azc:
-            result = var_df.to_csv_az(path)
+        result = var_azc.write_csv(path=path, df=var_df, index=False, encoding="utf-8")
         assert result
+        # csv is written to the buffer directly
+        _, kwargs = _put.call_args
+        assert kwargs["data"].read() == var_df.to_csv(index=False).encode("utf-8")
+
+    @pytest.mark.parametrize("kwargs", [
+        {"index": False},
+        {"index": True},
+        {"sep": "\t", "header": False},
+    ])
+    def test_blob_to_csv_pyarrow(self, mocker, _put, var_azc, var_df, kwargs):
+        pytest.importorskip("pyarrow")
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
+        # the file below is not exists
+        path = f"{BLOB_BASE}test.csv"
 
-class TestToTsv:
-    def test_blob_to_table(self, mocker, _put, var_azc, var_df):
+        result = var_azc.write_csv(path=path, df=var_df, engine="pyarrow", **kwargs)
+        assert result
+        _, put_kwargs = _put.call_args
+        read_kwargs = {"sep": kwargs.get("sep", ","), "header": 0 if kwargs.get("header", True) else None}
+        df = pd.read_csv(put_kwargs["data"], **read_kwargs)
+        expected = pd.read_csv(io.BytesIO(var_df.to_csv(**kwargs).encode("utf-8")), **read_kwargs)
+        assert df.values.tolist() == expected.values.tolist()
+
+    @pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+    def test_blob_to_csv_zstd(self, mocker, _put, var_azc, var_df, engine):
+        pytest.importorskip("zstandard")
+        pytest.importorskip(engine)
         mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.tsv"
+        path = f"{BLOB_BASE}test.csv.zst"
 
-        with var_azc:
-            result = var_df.to_table_az(path)
+        result = var_azc.write_csv(path=path, df=var_df, engine=engine, compression="zstd", index=False)
         assert result
+        _, kwargs = _put.call_args
+        # read_csv(compression="zstd") requires pandas>=1.4
+        df = pd.read_csv(azfs.utils.decompress_stream(io.BytesIO(kwargs["data"].read()), compression="zstd"))
+        expected = pd.read_csv(io.BytesIO(var_df.to_csv(index=False).encode("utf-8")))
+        assert df.values.tolist() == expected.values.tolist()
+
 
-    def test_dfs_to_table(self, mocker, _put, var_azc, var_df):
-        mocker.patch.object(AzDataLakeClient, "_put", _put)
+class TestToTsv:
+    def test_to_table(self, client_kind, mocker, _put, var_azc, var_df):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.tsv"
+        path = f"{container_url}test.tsv"
 
         with var_azc:
             result = var_df.to_table_az(path)
@@ -460,250 +533,415 @@ class TestToTsv:
 
 
 class TestToPickle:
-    def test_blob_to_pickle(self, mocker, _put, var_azc, var_df):
-        mocker.patch.object(AzBlobClient, "_put", _put)
+    @pytest.mark.parametrize("compression", [None, "gzip", "bz2", "xz"])
+    def test_to_pickle(self, client_kind, mocker, _put, var_azc, var_df, compression):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.pkl"
+        path = f"{container_url}test.pkl"
 
         with var_azc:
-            result = var_df.to_pickle_az(path)
-            assert result
-            result = var_df.to_pickle_az(path, compression=None)
-            assert result
-            result = var_df.to_pickle_az(path, compression="gzip")
-            assert result
-            result = var_df.to_pickle_az(path, compression="bz2")
-            assert result
-            result = var_df.to_pickle_az(path, compression="xz")
-            assert result
+            result = var_df.to_pickle_az(path, compression=compression)
+        assert result
+        _, kwargs = _put.call_args
+        data = kwargs["data"]
+        file_obj = io.BytesIO(data) if isinstance(data, bytes) else data
+        assert pd.read_pickle(file_obj, compression=compression).equals(var_df)
 
-    def test_dfs_to_pickle(self, mocker, _put, var_azc, var_df):
-        mocker.patch.object(AzDataLakeClient, "_put", _put)
+    def test_blob_to_pickle_default(self, mocker, _put, var_azc, var_df):
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.pkl"
+        path = f"{BLOB_BASE}test.pkl"
 
         with var_azc:
             result = var_df.to_pickle_az(path)
             assert result
-            result = var_df.to_pickle_az(path, compression=None)
-            assert result
-            result = var_df.to_pickle_az(path, compression="gzip")
-            assert result
-            result = var_df.to_pickle_az(path, compression="bz2")
+            result = var_df.to_pickle_az(path, compression=None, protocol=4)
             assert result
-            result = var_df.to_pickle_az(path, compression="xz")
-            assert result
-
+        _, kwargs = _put.call_args
+        assert pd.read_pickle(io.BytesIO(kwargs["data"])).equals(var_df)
 
-class TestToJson:
 
-    def test_blob_to_csv(self, mocker, _put, var_azc):
+class TestToParquet:
+    def test_blob_to_parquet(self, mocker, _put, var_azc, var_df):
+        pytest.importorskip("pyarrow")
         mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test.json"
+        path = f"{BLOB_BASE}test.parquet"
 
-        result = var_azc.write_json(path, data={"a": "b"})
+        with var_azc:
+            result = var_df.to_parquet_az(path)
         assert result
+        _, kwargs = _put.call_args
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = kwargs["data"].read()
+        mocker.patch.object(AzBlobClient, "_get", func_mock)
+        pd.testing.assert_frame_equal(var_azc.read_parquet(path=path), var_df)
+
+
+class TestToJson:
 
-    def test_dfs_to_csv(self, mocker, _put, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_put", _put)
+    def test_to_csv(self, client_kind, mocker, _put, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test.json"
+        path = f"{container_url}test.json"
 
         result = var_azc.write_json(path, data={"a": "b"})
         assert result
+        _, kwargs = _put.call_args
+        assert isinstance(kwargs["data"], bytes)
+        assert json.loads(kwargs["data"]) == {"a": "b"}
 
 
 class TestLs:
-    def test_blob_ls(self, mocker, _ls, var_azc):
-        mocker.patch.object(AzBlobClient, "_ls", _ls)
+    def test_ls(self, client_kind, mocker, _ls, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_ls", _ls)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/"
+        path = container_url
 
         file_list = var_azc.ls(path=path)
         assert len(file_list) == 3
-        assert "test1.csv" in file_list
-        assert "test2.csv" in file_list
-        assert "dir/" in file_list
+        assert set(file_list) == {"test1.csv", "test2.csv", "dir/"}
 
-    def test_blob_ls_full_path(self, mocker, _ls, var_azc):
-        mocker.patch.object(AzBlobClient, "_ls", _ls)
+    def test_ls_full_path(self, client_kind, mocker, _ls, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_ls", _ls)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/"
+        path = container_url
 
         file_list = var_azc.ls(path=path, attach_prefix=True)
         assert len(file_list) == 3
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/test1.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/test2.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/dir/" in file_list
+        assert set(file_list) == {
+            f"{container_url}test1.csv",
+            f"{container_url}test2.csv",
+            f"{container_url}dir/",
+        }
 
-    def test_dfs_ls(self, mocker, _ls, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_ls", _ls)
+    def test_blob_ils(self, mocker, _ls, var_azc):
+        mocker.patch.object(AzBlobClient, "_ls", _ls)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/"
+        path = "https://testazfs.blob.core.windows.net/test_caontainer"
 
-        file_list = var_azc.ls(path=path)
+        file_iter = var_azc.ils(path=path, attach_prefix=True)
+        assert not isinstance(file_iter, list)
+        file_list = list(file_iter)
         assert len(file_list) == 3
-        assert "test1.csv" in file_list
-        assert "test2.csv" in file_list
-        assert "dir/" in file_list
+        assert f"{BLOB_BASE}test1.csv" in file_list
 
-    def test_dfs_ls_full_path(self, mocker, _ls, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_ls", _ls)
+    def test_blob_ls_folder(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = ["folder/test1.csv", "folder/dir/"]
+        mocker.patch.object(AzBlobClient, "_ls", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/"
+        path = f"{BLOB_BASE}folder"
 
-        file_list = var_azc.ls(path=path, attach_prefix=True)
-        assert len(file_list) == 3
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/test1.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/test2.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/dir/" in file_list
+        file_list = var_azc.ls(path=path)
+        assert file_list == ["test1.csv", "dir/"]
+        # files directly under the folder are listed by the server
+        _, kwargs = func_mock.call_args
+        assert kwargs["file_path"] == "folder/"
+        assert kwargs["delimiter"] == "/"
+
+
+# pattern and the expected files under the container, for the files listed by `_ls_for_glob`
+GLOB_CASES = [
+    ("root_folder/*.csv", ["root_folder/test1.csv", "root_folder/test2.csv"]),
+    ("root_folder/*.json", ["root_folder/test1.json"]),
+    ("root_folder/*/*.csv", [
+        "root_folder/dir1/test1.csv",
+        "root_folder/dir1/test2.csv",
+        "root_folder/dir2/test1.csv",
+        "root_folder/dir2/test2.csv",
+    ]),
+    ("root_folder/dir1/*.csv", ["root_folder/dir1/test1.csv", "root_folder/dir1/test2.csv"]),
+]
 
 
 class TestGlob:
-    def test_blob_glob_error(self, var_azc):
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test1.csv"
+    def test_glob_error(self, client_kind, var_azc):
+        container_url, _ = client_kind
+        path = f"{container_url}test1.csv"
         with pytest.raises(AzfsInputError):
             var_azc.glob(path)
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/*"
+        path = f"{container_url}*"
         with pytest.raises(AzfsInputError):
             var_azc.glob(path)
 
-    def test_blob_glob(self, mocker, _ls_for_glob, var_azc):
-        mocker.patch.object(AzBlobClient, "_ls", _ls_for_glob)
+    @pytest.mark.parametrize("pattern, expected", GLOB_CASES)
+    def test_glob(self, client_kind, mocker, _ls_for_glob, var_azc, pattern, expected):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_ls", _ls_for_glob)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.csv"
+        file_list = var_azc.glob(pattern_path=f"{container_url}{pattern}")
+        assert len(file_list) == len(expected)
+        assert set(file_list) == {f"{container_url}{file_name}" for file_name in expected}
+
+    def test_blob_glob_escape(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = [
+            "root_folder/test1.csv",
+            "root_folder/test1_csv",
+            "root_folder/test(1).csv",
+        ]
+        mocker.patch.object(AzBlobClient, "_ls", func_mock)
+
+        # `.`, `(` and `)` must be matched literally
+        path = f"{BLOB_BASE}root_folder/*.csv"
         file_list = var_azc.glob(pattern_path=path)
         assert len(file_list) == 2
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test1.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test2.csv" in file_list
+        assert f"{BLOB_BASE}root_folder/test1.csv" in file_list
+        assert f"{BLOB_BASE}root_folder/test(1).csv" in file_list
 
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*.json"
+        path = f"{BLOB_BASE}root_folder/test(*).csv"
         file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 1
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/test1.json" in file_list
+        assert file_list == [f"{BLOB_BASE}root_folder/test(1).csv"]
 
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/*/*.csv"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 4
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test1.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test2.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir2/test1.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir2/test2.csv" in file_list
 
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/*.csv"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 2
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test1.csv" in file_list
-        assert "https://testazfs.blob.core.windows.net/test_caontainer/root_folder/dir1/test2.csv" in file_list
+class TestGetPutMany:
+    def test_blob_get_many(self, mocker, _get_csv, var_azc):
+        mocker.patch.object(AzBlobClient, "_get", _get_csv)
 
-    def test_dfs_glob_error(self, var_azc):
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/test1.csv"
-        with pytest.raises(AzfsInputError):
-            var_azc.glob(path)
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/*"
-        with pytest.raises(AzfsInputError):
-            var_azc.glob(path)
+        # the file below is not exists
+        path_list = [
+            f"{BLOB_BASE}test1.csv",
+            f"{BLOB_BASE}test2.csv"
+        ]
+        data_list = var_azc.get_many(path_list)
+        assert data_list == [_get_csv.return_value, _get_csv.return_value]
 
-    def test_dfs_glob(self, mocker, _ls_for_glob, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_ls", _ls_for_glob)
+    def test_blob_put_many(self, mocker, _put, var_azc):
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/*.csv"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 2
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/test1.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/test2.csv" in file_list
+        path_data_dict = {
+            f"{BLOB_BASE}test1.json": b'{"a": 1}',
+            f"{BLOB_BASE}test2.json": b'{"a": 2}'
+        }
+        assert var_azc.put_many(path_data_dict)
+        assert _put.call_count == 2
 
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/*.json"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 1
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/test1.json" in file_list
+    def test_blob_get_many_async(self, mocker):
+        async def _download(self, path, *args, **kwargs):
+            return path.encode("utf-8")
+        mocker.patch.object(azfs.AsyncAzFileClient, "_download", _download)
 
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/*/*.csv"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 4
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir1/test1.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir1/test2.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir2/test1.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir2/test2.csv" in file_list
+        # the file below is not exists
+        path_list = [
+            f"{BLOB_BASE}test1.csv",
+            f"{BLOB_BASE}test2.csv"
+        ]
 
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir1/*.csv"
-        file_list = var_azc.glob(pattern_path=path)
-        assert len(file_list) == 2
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir1/test1.csv" in file_list
-        assert "https://testazfs.dfs.core.windows.net/test_caontainer/root_folder/dir1/test2.csv" in file_list
+        async def main():
+            async with azfs.AsyncAzFileClient(credential="") as aazc:
+                return await aazc.get_many(path_list)
+        assert _run_until_complete(main()) == [path.encode("utf-8") for path in path_list]
 
 
-class TestRm:
-    def test_blob_rm(self, mocker, _rm, var_azc):
-        mocker.patch.object(AzBlobClient, "_rm", _rm)
+class TestCp:
+    def test_blob_cp(self, mocker, _get_csv_gz, _put, var_azc):
+        mocker.patch.object(AzBlobClient, "_get", _get_csv_gz)
+        mocker.patch.object(AzBlobClient, "_put", _put)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/"
+        src_path = f"{BLOB_BASE}test.csv.gz"
+        dst_path = f"{BLOB_BASE}test_copy.csv.gz"
 
-        result = var_azc.rm(path=path)
+        result = var_azc.cp(src_path=src_path, dst_path=dst_path, overwrite=True)
         assert result
+        # compressed data is copied as it is
+        _, kwargs = _put.call_args
+        assert kwargs["data"] == _get_csv_gz.return_value
 
-    def test_dfs_rm(self, mocker, _rm, var_azc):
-        mocker.patch.object(AzDataLakeClient, "_rm", _rm)
+
+class TestRm:
+    def test_rm(self, client_kind, mocker, _rm, var_azc):
+        container_url, client_class = client_kind
+        mocker.patch.object(client_class, "_rm", _rm)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/"
+        path = container_url
 
         result = var_azc.rm(path=path)
         assert result
 
 
+class TestInfo:
+    def test_blob_info_cached(self, mocker, _put, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = {"size": 1, "etag": "etag", "content_settings": {"content_type": "text/csv"}}
+        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(AzBlobClient, "_put", _put)
+
+        # the file below is not exists
+        path = f"{BLOB_BASE}test1.csv"
+
+        assert var_azc.isfile(path=path)
+        assert var_azc.size(path=path) == 1
+        assert var_azc.checksum(path=path) == "etag"
+        assert func_mock.call_count == 1
+
+        # writing the file invalidates the cache
+        var_azc.write_json(path=path, data={})
+        assert var_azc.size(path=path) == 1
+        assert func_mock.call_count == 2
+
+    def test_blob_info_cache_evicted(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = {"size": 1, "content_settings": {"content_type": "text/csv"}}
+        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(var_azc, "INFO_CACHE_MAX_SIZE", 2)
+
+        # the files below are not exists
+        path_list = [f"{BLOB_BASE}test{i}.csv" for i in range(3)]
+        for path in path_list:
+            assert var_azc.size(path=path) == 1
+        # the oldest path is removed
+        assert list(var_azc._info_cache) == path_list[1:]
+
+
 class TestExists:
-    def test_blob_exists(self, mocker, var_azc):
+    def test_exists(self, client_kind, mocker, var_azc):
+        container_url, client_class = client_kind
         return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
         func_mock = mocker.MagicMock()
         func_mock.return_value = return_value
-        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(client_class, "_info", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test1.csv"
+        path = f"{container_url}test1.csv"
 
         result = var_azc.exists(path=path)
         assert result
 
-        # set to raise exception
+    def test_not_exists(self, client_kind, mocker, var_azc):
+        container_url, client_class = client_kind
+        func_mock = mocker.MagicMock()
         func_mock.side_effect = ResourceNotFoundError
+        mocker.patch.object(client_class, "_info", func_mock)
+        ls_mock = mocker.MagicMock()
+        mocker.patch.object(client_class, "_ls", ls_mock)
+
+        # the file below is not exists
+        path = f"{container_url}not_exist_test1.csv"
+
+        assert not var_azc.exists(path=path)
+        # only the properties of the file are requested, without listing the folder
+        func_mock.assert_called_once()
+        ls_mock.assert_not_called()
+
+    def test_blob_exists_cached(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = {"size": 1}
         mocker.patch.object(AzBlobClient, "_info", func_mock)
+
         # the file below is not exists
-        path = "https://testazfs.blob.core.windows.net/test_caontainer/test3.csv"
-        result = var_azc.exists(path=path)
-        assert not result
+        path = f"{BLOB_BASE}test1.csv"
 
-    def test_dfs_exists(self, mocker, _get_csv, var_azc):
-        return_value = {"size": len(b'name,age\nalice,10\nbob,10\n')}
+        assert var_azc.exists(path=path)
+        assert var_azc.exists(path=path)
+        assert func_mock.call_count == 1
+
+    def test_blob_prewarm_container(self, mocker, _ls, var_azc):
+        mocker.patch.object(AzBlobClient, "_ls", _ls)
         func_mock = mocker.MagicMock()
-        func_mock.return_value = return_value
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
+        mocker.patch.object(AzBlobClient, "_info", func_mock)
 
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test1.csv"
+        path = "https://testazfs.blob.core.windows.net/test_caontainer"
 
-        result = var_azc.exists(path=path)
-        assert result
+        assert var_azc.prewarm_container(path=path) == 2
+        assert var_azc.exists(path=f"{path}/test1.csv")
+        assert var_azc.exists(path=f"{path}/test2.csv")
+        func_mock.assert_not_called()
+
+    def test_blob_prewarm_container_max_size(self, mocker, _ls, var_azc):
+        mocker.patch.object(AzBlobClient, "_ls", _ls)
+        mocker.patch.object(var_azc, "EXISTENCE_CACHE_MAX_SIZE", 1)
 
-        # set to raise exception
-        func_mock.side_effect = ResourceNotFoundError
-        mocker.patch.object(AzDataLakeClient, "_info", func_mock)
         # the file below is not exists
-        path = "https://testazfs.dfs.core.windows.net/test_caontainer/test3.csv"
-        result = var_azc.exists(path=path)
-        assert not result
+        path = "https://testazfs.blob.core.windows.net/test_caontainer"
+
+        assert var_azc.prewarm_container(path=path) == 1
+        assert len(var_azc._existence_cache) == 1
+
+    def test_blob_exists_cache_evicted(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = {"size": 1}
+        mocker.patch.object(AzBlobClient, "_info", func_mock)
+        mocker.patch.object(var_azc, "EXISTENCE_CACHE_MAX_SIZE", 2)
+
+        # the files below are not exists
+        path_list = [f"{BLOB_BASE}test{i}.csv" for i in range(3)]
+        for path in path_list:
+            assert var_azc.exists(path=path)
+        # the oldest path is removed
+        assert list(var_azc._existence_cache) == path_list[1:]
+
+        # expired entries are removed when another path is cached
+        mocker.patch.object(var_azc, "EXISTENCE_CACHE_TTL", 0)
+        assert var_azc.exists(path=path_list[0])
+        assert len(var_azc._existence_cache) == 0
+
+    def test_blob_exists_folder(self, mocker, var_azc):
+        func_mock = mocker.MagicMock()
+        func_mock.return_value = iter([mocker.MagicMock()])
+        mocker.patch.object(ContainerClient, "list_blobs", func_mock)
+        info_mock = mocker.MagicMock()
+        mocker.patch.object(AzBlobClient, "_info", info_mock)
+
+        # the folder below is not exists
+        path = f"{BLOB_BASE}folder/"
+
+        assert var_azc.exists(path=path)
+        # blob storage has no folder, so that only the first blob under the folder is listed
+        _, kwargs = func_mock.call_args
+        assert kwargs["name_starts_with"] == "folder/"
+        assert kwargs["results_per_page"] == 1
+        info_mock.assert_not_called()
+
+        func_mock.return_value = iter([])
+        path = f"{BLOB_BASE}empty_folder/"
+        assert not var_azc.exists(path=path)
+
+
+class TestContextManager:
+
+    def test_nested_with(self, var_azc):
+        another_azc = azfs.AzFileClient()
+        with var_azc:
+            read_csv_az = pd.read_csv_az
+            with var_azc:
+                # the same client is not attached again
+                assert pd.read_csv_az is read_csv_az
+            assert pd.read_csv_az is read_csv_az
+            with another_azc:
+                assert pd.read_csv_az is not read_csv_az
+            # the outer client is attached again
+            assert pd.read_csv_az is read_csv_az
+        assert pd.read_csv_az is None
+
+    def test_exit_out_of_order(self, var_azc):
+        another_azc = azfs.AzFileClient()
+        var_azc.__enter__()
+        read_csv_az = pd.read_csv_az
+        another_azc.__enter__()
+        # the outer client exits first, the inner client is still attached
+        var_azc.__exit__(None, None, None)
+        assert pd.read_csv_az is not None
+        assert pd.read_csv_az is not read_csv_az
+        another_azc.__exit__(None, None, None)
+        assert pd.read_csv_az is None
 
 
 class TestExportDecorator:
@@ -870,4 +1108,4 @@ class TestExportDecorator:
             _prod_file_name_prefix="prefix",
             _prod_file_name="the_file_name",
             _prod_file_name_suffix="suffix"
-        )
\ No newline at end of file
+        )
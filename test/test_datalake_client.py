@@ -1,6 +1,9 @@
+import io
 import json
+import math
 import pytest
 from azfs.clients.datalake_client import AzDataLakeClient
+from azfs.error import AzfsInputError
 from azure.storage.filedatalake import FileSystemClient, DataLakeFileClient
 import azfs
 
@@ -13,6 +16,12 @@ test_file_path = "https://test.dfs.core.windows.net/test/test.csv"
 test_file_ls_path = "https://test.dfs.core.windows.net/test/"
 
 
+@pytest.fixture(autouse=True)
+def _invalidate_cache():
+    # `azc` is shared among the tests, so drop the cached file properties
+    azc.invalidate(path=test_file_path)
+
+
 class BlobMock:
     # dummy blob file class
     def __init__(self, name):
@@ -139,9 +148,38 @@ def test_blob_upload(mocker, datalake_client):
     result = datalake_client.put(path=test_file_path, data=data)
 
     assert result
-    append_data_mock.assert_called_with(data=data, offset=0, length=len(data))
+    append_data_mock.assert_called_with(data=data.encode("utf-8"), offset=0, length=len(data))
     flush_data_mock.assert_called_with(len(data))
 
+    # str is encoded before splitting, so that offsets and the length are counted in bytes
+    multibyte_data = json.dumps({"example": "データ"}, ensure_ascii=False)
+    result = datalake_client.put(path=test_file_path, data=multibyte_data)
+    assert result
+    encoded_data = multibyte_data.encode("utf-8")
+    append_data_mock.assert_called_with(data=encoded_data, offset=0, length=len(encoded_data))
+    flush_data_mock.assert_called_with(len(encoded_data))
+
+    # file-like object is also uploaded
+    result = datalake_client.put(path=test_file_path, data=io.BytesIO(data.encode("utf-8")))
+    assert result
+    append_data_mock.assert_called_with(data=data.encode("utf-8"), offset=0, length=len(data))
+
+    # data is split into chunks, uploaded at most `max_concurrency` at the same time, and flushed at once
+    append_data_mock.reset_mock()
+    flush_data_mock.reset_mock()
+    result = datalake_client.put(path=test_file_path, data=data, chunk_size=4, max_concurrency=2)
+    assert result
+    assert append_data_mock.call_count == math.ceil(len(data) / 4)
+    offsets = sorted(kwargs["offset"] for _, kwargs in append_data_mock.call_args_list)
+    assert offsets == list(range(0, len(data), 4))
+
+    # text-mode file-like object is rejected, before creating the file
+    create_file_mock.reset_mock()
+    with pytest.raises(AzfsInputError):
+        datalake_client.put(path=test_file_path, data=io.StringIO(data))
+    create_file_mock.assert_not_called()
+    flush_data_mock.assert_called_once_with(len(data))
+
 
 @pytest.mark.parametrize("datalake_client", [
     # blob client
@@ -1,7 +1,21 @@
+import gzip
+import io
+import json
+import math
+import pickle
 import pytest
 from azfs.utils import (
     BlobPathDecoder,
-    ls_filter
+    MemoryViewIO,
+    compress_stream,
+    decompress_stream,
+    gzip_decompress,
+    is_gzip_compressed,
+    json_dumps,
+    json_loads,
+    ls_filter,
+    pickle_dumps_out_of_band,
+    pickle_load
 )
 from azfs.error import (
     AzfsInputError,
@@ -70,6 +84,28 @@ class TestBlobPathDecoder:
         assert container_name_v == container_name
         assert blob_file_v == blob_file
 
+    def test_add_pattern_after_decode(self):
+        path = "test@blob@test/test_file.csv"
+        with pytest.raises(AzfsInvalidPathError):
+            BlobPathDecoder(path)
+
+        # cached result must not be used after adding new pattern
+        BlobPathDecoder.add_pattern(pattern="%A@%T@%C/%B")
+        assert BlobPathDecoder(path).get() == ("test", "blob", "test", "test_file.csv")
+
+    def test_decode_with_url(self):
+        path = "https://test.blob.core.windows.net/test/test_file.csv"
+        expected = BlobPathDecoder(path).get_with_url()
+        assert BlobPathDecoder.decode_with_url(path) == expected
+        assert BlobPathDecoder.decode_with_url(path) == expected
+
+        path = "test#blob#test/test_file.csv"
+        with pytest.raises(AzfsInvalidPathError):
+            BlobPathDecoder.decode_with_url(path)
+        BlobPathDecoder.add_pattern(pattern="%A#%T#%C/%B")
+        expected = ("https://test.blob.core.windows.net", "blob", "test", "test_file.csv")
+        assert BlobPathDecoder.decode_with_url(path) == expected
+
     def test_add_pattern_error(self):
         # shortage of %
         path_pattern = "%A=%T=%C"
@@ -82,6 +118,20 @@ class TestBlobPathDecoder:
             BlobPathDecoder.add_pattern(pattern=path_pattern)
 
 
+@pytest.mark.parametrize("path,data,expected", [
+    ("test.csv.gz", gzip.compress(b"name,age"), True),
+    ("test.csv.GZIP", gzip.compress(b"name,age"), True),
+    # already decompressed with `Content-Encoding: gzip`
+    ("test.csv.gz", b"name,age", False),
+    ("test.csv", gzip.compress(b"name,age"), False),
+    # bytes-like object
+    ("test.csv.gz", memoryview(gzip.compress(b"name,age")), True),
+    ("test.csv.gz", bytearray(b"name,age"), False),
+])
+def test_is_gzip_compressed(path, data, expected):
+    assert is_gzip_compressed(path=path, data=data) == expected
+
+
 class TestLsFilter:
     def test_ls_filter(self):
         file_path_list = [
@@ -115,3 +165,117 @@ class TestLsFilter:
         ]
         result_list_v = ls_filter(file_path_list, "dir/some")
         assert result_list_v == result_list
+
+
+@pytest.mark.parametrize("data, kwargs, expected", [
+    (b'{"a": 1.5}', {}, {"a": 1.5}),
+    (memoryview(b'{"a": 1.5}'), {}, {"a": 1.5}),
+    ('{"a": 1.5}', {"parse_float": str}, {"a": "1.5"}),
+    (memoryview(b'{"a": 1.5}'), {"parse_float": str}, {"a": "1.5"}),
+])
+def test_json_loads(data, kwargs, expected):
+    assert json_loads(data, **kwargs) == expected
+    assert json_loads(data, use_orjson=True, **kwargs) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_loads_round_trip(use_orjson):
+    # NaN and Infinity are written by json.dumps() by default
+    data = json_loads(json_dumps({"a": float("nan"), "b": float("inf")}), use_orjson=use_orjson)
+    assert math.isnan(data["a"])
+    assert data["b"] == float("inf")
+
+
+def test_json_loads_big_int():
+    data = {"a": 123456789012345678901234567890}
+    assert json_loads(json_dumps(data)) == data
+
+
+@pytest.mark.parametrize("data, kwargs", [
+    ({"a": 1.5, "b": "日本語"}, {}),
+    ({1: "a"}, {}),
+    ({"a": 1.5, "b": "日本語"}, {"indent": 2}),
+])
+def test_json_dumps(data, kwargs):
+    dumped = json_dumps(data, **kwargs)
+    assert type(dumped) is bytes
+    # keys are converted to str
+    assert json_loads(dumped) == {str(k): v for k, v in data.items()}
+
+
+@pytest.mark.parametrize("data", [
+    {"a": float("nan"), "b": float("inf")},
+    {"a": 123456789012345678901234567890},
+    {"a": 1.5, "b": "日本語"},
+])
+def test_json_dumps_as_same_as_json(data):
+    # the output does not depend on whether orjson is installed
+    assert json_dumps(data) == json.dumps(data).encode("utf-8")
+
+
+def test_json_dumps_use_orjson():
+    pytest.importorskip("orjson")
+    assert json_loads(json_dumps({1: "a"}, use_orjson=True)) == {"1": "a"}
+    # integers wider than 64 bits are serialized by json
+    data = {"a": 123456789012345678901234567890}
+    assert json_dumps(data, use_orjson=True) == json.dumps(data).encode("utf-8")
+
+
+def test_memory_view_io():
+    data = b"0123456789"
+    file_obj = MemoryViewIO(memoryview(data))
+    assert file_obj.read(4) == b"0123"
+    assert file_obj.tell() == 4
+    assert file_obj.seek(0, io.SEEK_END) == len(data)
+    assert file_obj.read() == b""
+    file_obj.seek(8)
+    assert file_obj.read() == b"89"
+
+
+def test_memory_view_io_multiple_views():
+    file_obj = MemoryViewIO(b"012", memoryview(b"3456"), b"", b"789")
+    assert file_obj.read(2) == b"01"
+    assert file_obj.read(5) == b"23456"
+    file_obj.seek(1)
+    assert file_obj.read() == b"123456789"
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="pickle protocol 5 requires python>=3.8")
+def test_pickle_load_out_of_band():
+    np = pytest.importorskip("numpy")
+    data = {"a": np.arange(10), "b": "text"}
+    result = pickle_load(MemoryViewIO(*pickle_dumps_out_of_band(data)))
+    assert (result["a"] == data["a"]).all()
+    assert result["b"] == "text"
+    # plain pickle is also readable
+    assert pickle_load(io.BytesIO(pickle.dumps(data)))["b"] == "text"
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compress_stream(compression):
+    file_obj = io.BytesIO()
+    with compress_stream(file_obj, compression=compression) as f:
+        f.write(b"some data")
+    # the file_obj is not closed with the compressed stream
+    file_obj.seek(0)
+    assert decompress_stream(file_obj, compression=compression).read() == b"some data"
+
+
+def test_compress_stream_not_supported():
+    with pytest.raises(AzfsInputError):
+        compress_stream(io.BytesIO(), compression="zip")
+
+
+def test_compress_stream_gzip_compatible_with_isal():
+    pytest.importorskip("isal")
+    file_obj = io.BytesIO()
+    with compress_stream(file_obj, compression="gzip") as f:
+        f.write(b"some data")
+    # readable by the standard gzip module
+    assert gzip.decompress(file_obj.getvalue()) == b"some data"
+
+
+def test_gzip_decompress():
+    data = gzip.compress(b"some data")
+    assert gzip_decompress(data) == b"some data"
+    assert decompress_stream(io.BytesIO(data), compression="gzip").read() == b"some data"